@@ -33,6 +33,7 @@ def executar_teste():
         ("Decomposição LU", "decomposicao_lu"),
         ("Jacobi", "jacobi"),
         ("Gauss Seidel", "gauss_seidel"),
+        ("GMRES", "gmres"),
     ]
 
     for metodo_nome, metodo_nome_funcao in metodos:
@@ -30,6 +30,7 @@ def executar_teste():
     metodos = [
         ("Bisseção", "bissecao"),
         ("Secante", "secante"),
+        ("Brent", "brent"),
         ("Newton Raphson", "newton_raphson"),
     ]
 
@@ -54,6 +55,19 @@ def executar_teste():
 
         timer.end()
 
+    print("\nTodas as raízes no intervalo: ")
+
+    solvers = SolversNaoLineares()
+
+    timer = Timer()
+    timer.start()
+
+    raizes = solvers.todas_raizes(funcoes[escolha_sistema], x0, x1, tol, lim_iter)
+
+    print(f"\tX = {raizes}")
+
+    timer.end()
+
 
 def main():
     while True:
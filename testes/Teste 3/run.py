@@ -1,3 +1,5 @@
+import copy
+
 from utils.arquivos import ler_json
 from utils.benchmark import Timer
 from utils.flupot import Flupot
@@ -37,6 +39,7 @@ def executar_teste():
     metodos = [
         ("Linearizado", "linearizado"),
         ("Newton Raphson", "newton_raphson"),
+        ("Desacoplado Rápido", "desacoplado_rapido"),
     ]
 
     for metodo_nome, metodo_nome_funcao in metodos:
@@ -50,7 +53,11 @@ def executar_teste():
             timer = Timer()
             timer.start()
 
-            resultado = metodo_funcao(dados_barras, dados_linhas)
+            # Cada método recebe uma cópia dos dados lidos, já que os resultados
+            # são escritos de volta nas barras e linhas.
+            resultado = metodo_funcao(
+                copy.deepcopy(dados_barras), copy.deepcopy(dados_linhas)
+            )
 
             print("\nResultado das barras: ")
             print_table(resultado["BARRAS"])
@@ -62,6 +69,25 @@ def executar_teste():
         except Exception as e:
             print(e)
 
+    # Análise de contingências N-1
+    for modelo_nome, modelo in (("DC", "dc"), ("AC", "ac")):
+        try:
+            print(f"\nContingências N-1 (modelo {modelo_nome}): ")
+
+            flupot = Flupot()
+
+            timer = Timer()
+            timer.start()
+
+            relatorio = flupot.contingencias(
+                copy.deepcopy(dados_barras), copy.deepcopy(dados_linhas), modelo=modelo
+            )
+            print_table(relatorio)
+
+            timer.end()
+        except Exception as e:
+            print(e)
+
 
 def main():
     while True:
@@ -1,5 +1,8 @@
+import csv
 import json
-from typing import List, Union
+import queue
+import threading
+from typing import Dict, Iterator, List, Sequence, Union
 
 
 def ler_matriz_csv(
@@ -35,4 +38,95 @@ def ler_matriz_csv(
 def ler_json(nome_arquivo):
     with open(nome_arquivo, 'r') as file:
         dict = json.load(file)
-    return dict
\ No newline at end of file
+    return dict
+
+
+def _converter(valor: str) -> Union[str, float]:
+    try:
+        return float(valor)
+    except ValueError:
+        return valor
+
+
+def ler_csv_incremental(
+    nome_arquivo: str, delimitador: str = ","
+) -> Iterator[Dict[str, Union[str, float]]]:
+    """
+    Lê um arquivo CSV linha a linha, sem carregá-lo inteiro na memória,
+    retornando cada linha como um dicionário indexado pelo cabeçalho.
+    """
+    with open(nome_arquivo, "r", newline="") as arquivo:
+        for linha in csv.DictReader(arquivo, delimiter=delimitador):
+            yield {chave: _converter(valor) for chave, valor in linha.items()}
+
+
+class EscritorCSV:
+    """
+    Escreve linhas em um arquivo CSV de forma incremental. A escrita é feita
+    por uma thread separada a partir de uma fila limitada, de modo que quem
+    produz as linhas não espera pelo disco.
+    """
+
+    def __init__(
+        self,
+        nome_arquivo: str,
+        cabecalho: Sequence[str],
+        delimitador: str = ",",
+        tamanho_fila: int = 1000,
+    ):
+        self.arquivo = open(nome_arquivo, "w", newline="")
+        self.escritor = csv.writer(self.arquivo, delimiter=delimitador)
+        self.escritor.writerow(cabecalho)
+        self.fila = queue.Queue(maxsize=tamanho_fila)
+        self.erro = None
+        self.thread = threading.Thread(target=self._consumir, daemon=True)
+        self.thread.start()
+
+    def _consumir(self):
+        try:
+            while True:
+                linha = self.fila.get()
+                if linha is None:
+                    break
+                self.escritor.writerow(linha)
+        except Exception as erro:
+            # Guardado para ser relançado na thread que produz as linhas.
+            self.erro = erro
+
+    def _verificar(self):
+        if self.erro is not None:
+            raise RuntimeError(
+                f"Falha ao escrever em {self.arquivo.name}: {self.erro}"
+            ) from self.erro
+
+    def _enfileirar(self, linha) -> bool:
+        """
+        Coloca a linha na fila sem bloquear indefinidamente: se a thread de
+        escrita terminar, a espera é interrompida.
+        """
+        while self.thread.is_alive():
+            try:
+                self.fila.put(linha, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def escrever(self, linha: Sequence):
+        self._verificar()
+        if not self._enfileirar(linha):
+            self._verificar()
+
+    def fechar(self):
+        try:
+            self._enfileirar(None)
+            self.thread.join()
+        finally:
+            self.arquivo.close()
+        self._verificar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
@@ -1,45 +1,109 @@
-from utils.algebra import Angulo, Matriz
+import copy
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from utils.algebra import Angulo, MatrizEsparsa
+from utils.arquivos import EscritorCSV, ler_csv_incremental
 from utils.solver import SolversLineares
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.csgraph as csgraph
+import scipy.sparse.linalg as spla
+
+# Tipos de barra com P e V especificados.
+TIPOS_PV = ("PV", "Vθ")
 
 
 class Flupot:
-    def linearizado(self, dados_barras, dados_linhas):
-        from utils.arquivos import ler_json
+    def __init__(self, ordenacao=None):
+        # Ordenação de mínimo grau opcional (instância de Ordenacao) usada nas
+        # fatorações; por padrão, o SuperLU ordena as colunas (COLAMD).
+        self.ordenacao = ordenacao
+        # Resultado da última solução: estado (V em pu, θ em radianos),
+        # convergência e número de iterações.
+        self.estado = None
+        self.convergiu = False
+        self.iteracoes = 0
+        self.fatoracoes = 0
 
-        sistema = ler_json("testes/Teste 3/sistema1.json")
+    def matriz_admitancia(self, dados_linhas, num_barras):
+        """
+        Monta a matriz de admitância nodal (Ybus) em formato esparso (CSR)
+        diretamente a partir das linhas, acumulando as contribuições em
+        triplas (i, j, y).
+        """
+        de = np.array([linha["DE"] - 1 for linha in dados_linhas], dtype=int)
+        para = np.array([linha["PARA"] - 1 for linha in dados_linhas], dtype=int)
+        r = np.array([linha["r"] for linha in dados_linhas], dtype=float)
+        x = np.array([linha["x"] for linha in dados_linhas], dtype=float)
+        b = np.array([linha["b"] for linha in dados_linhas], dtype=float)
 
-        dados_barras = sistema["BARRAS"]
-        dados_linhas = sistema["LINHAS"]
-        ##############################################################################################################
+        y = 1 / (r + 1j * x)
+        b_shunt = 1j * b / 2
 
-        P = [barra["P (PU)"] for barra in dados_barras]
-        num_barras = len(P)
+        linhas = np.concatenate([de, para, de, para])
+        colunas = np.concatenate([para, de, de, para])
+        valores = np.concatenate([-y, -y, y + b_shunt, y + b_shunt])
 
-        m = Matriz()
-        B = m.zeros(num_barras, num_barras)
+        # Entradas repetidas (linhas em paralelo) são somadas na conversão para CSR.
+        return sp.coo_matrix(
+            (valores, (linhas, colunas)), shape=(num_barras, num_barras)
+        ).tocsr()
 
-        for linha in dados_linhas:
-            i = linha["DE"]
-            j = linha["PARA"]
-            x = linha["x"]
+    def matriz_susceptancia(self, dados_linhas, num_barras):
+        """
+        Monta a matriz B do modelo linearizado (susceptâncias 1/x, sem
+        resistências nem shunts) em formato esparso (CSR).
+        """
+        de = np.array([linha["DE"] - 1 for linha in dados_linhas], dtype=int)
+        para = np.array([linha["PARA"] - 1 for linha in dados_linhas], dtype=int)
+        susceptancia = 1 / np.array([linha["x"] for linha in dados_linhas], dtype=float)
 
-            susceptancia = 1 / x
+        linhas = np.concatenate([de, para, de, para])
+        colunas = np.concatenate([para, de, de, para])
+        valores = np.concatenate(
+            [-susceptancia, -susceptancia, susceptancia, susceptancia]
+        )
 
-            B[i - 1][j - 1] -= susceptancia  # Elemento fora da diagonal
-            B[j - 1][i - 1] -= susceptancia  # Matriz simétrica
-            B[i - 1][i - 1] += susceptancia  # Soma na diagonal
-            B[j - 1][j - 1] += susceptancia  # Soma na diagonal da outra barra
+        return sp.coo_matrix(
+            (valores, (linhas, colunas)), shape=(num_barras, num_barras)
+        ).tocsr()
 
-        B, _ = m.separar_sistema(B)
-        P = P[:-1]
+    def linearizado(self, dados_barras, dados_linhas, estado_inicial=None):
+        P = np.array([barra["P (PU)"] or 0.0 for barra in dados_barras], dtype=float)
+        num_barras = len(P)
 
-        s = SolversLineares()
-        theta = s.gauss_seidel(B, P)
-        theta_ref = next(
-            barra["θ (graus)"] for barra in dados_barras if barra["TIPO"] == "SLACK"
+        # Matriz B esparsa; a barra de referência (SLACK) é removida do sistema.
+        ref, _, _ = self.classificar_barras(dados_barras)
+        ref = int(ref[0])
+        nao_ref = np.array([i for i in range(num_barras) if i != ref], dtype=int)
+
+        B_completa = self.matriz_susceptancia(dados_linhas, num_barras)
+        self._verificar_ilhamento(B_completa)
+        B_reduzida = B_completa[nao_ref][:, nao_ref].tocoo()
+        B = MatrizEsparsa.de_triplas(
+            num_barras - 1,
+            num_barras - 1,
+            B_reduzida.row.tolist(),
+            B_reduzida.col.tolist(),
+            B_reduzida.data.tolist(),
         )
-        theta.append(theta_ref)
+
+        # Os ângulos são calculados em relação ao da referência (em radianos).
+        theta_ref = np.radians(dados_barras[ref]["θ (graus)"] or 0.0)
+
+        x0 = None
+        if estado_inicial is not None:
+            x0 = (np.asarray(estado_inicial[1])[nao_ref] - theta_ref).tolist()
+
+        s = SolversLineares()
+        theta = np.full(num_barras, theta_ref)
+        theta[nao_ref] += s.gauss_seidel(B, P[nao_ref].tolist(), omega="auto", x0=x0)
+        theta = theta.tolist()
+
+        self.estado = (np.ones(num_barras), np.array(theta))
 
         a = Angulo()
         teta_graus = a.r2g(theta)
@@ -58,7 +122,102 @@ class Flupot:
 
         return {"BARRAS": dados_barras, "LINHAS": dados_linhas}
 
-    def newton_raphson(self, dados_barras, dados_linhas):
+    def classificar_barras(self, dados_barras):
+        """
+        Separa os índices das barras de referência, PV e PQ a partir do campo
+        TIPO. Em sistema1.json a barra "Vθ" tem P e V especificados, sendo
+        tratada como barra de geração (PV).
+        """
+        tipos = [barra["TIPO"] for barra in dados_barras]
+        ref = np.array(
+            [i for i, tipo in enumerate(tipos) if tipo == "SLACK"], dtype=int
+        )
+        pv = np.array(
+            [i for i, tipo in enumerate(tipos) if tipo in TIPOS_PV], dtype=int
+        )
+        pq = np.array([i for i, tipo in enumerate(tipos) if tipo == "PQ"], dtype=int)
+
+        if len(ref) != 1:
+            raise ValueError("O sistema deve possuir exatamente uma barra SLACK.")
+
+        return ref, pv, pq
+
+    @staticmethod
+    def _verificar_ilhamento(matriz):
+        """
+        Verifica se a rede descrita pela matriz nodal (Ybus ou B) é conexa;
+        com partes ilhadas, B' é singular e o sistema não tem solução única.
+        """
+        componentes, _ = csgraph.connected_components(matriz, directed=False)
+        if componentes > 1:
+            raise ValueError(
+                f"A rede está ilhada em {componentes} partes; B' é singular."
+            )
+
+    @staticmethod
+    def _fatorar(matriz, ordenacao=None):
+        """
+        Fatora uma matriz esparsa pelo SuperLU, com a ordenação de colunas
+        COLAMD feita em C. Se `ordenacao` (instância de Ordenacao) for
+        informada, a matriz é antes reordenada pelo esquema de mínimo grau
+        (Tinney 2), reutilizado do cache da instância para a mesma topologia.
+        Retorna uma função que resolve o sistema para um lado direito.
+        """
+        if ordenacao is None:
+            return spla.splu(matriz.tocsc()).solve
+
+        estrutura = matriz.tocoo()
+        ordem = np.array(
+            ordenacao.minimo_grau(matriz.shape[0], estrutura.row, estrutura.col),
+            dtype=int,
+        )
+        lu = spla.splu(matriz.tocsr()[ordem][:, ordem].tocsc(), permc_spec="NATURAL")
+
+        def resolver(b):
+            x = np.empty_like(b)
+            x[ordem] = lu.solve(b[ordem])
+            return x
+
+        return resolver
+
+    @staticmethod
+    def _potencias(V, theta, Y):
+        """
+        Calcula os fasores de tensão, as correntes e as potências injetadas
+        S = V ∘ conj(Y V).
+        """
+        fasor = np.exp(1j * theta)
+        Vc = V * fasor
+        I = Y @ Vc
+        S = Vc * np.conj(I)
+        return Vc, fasor, I, S
+
+    @staticmethod
+    def _jacobiano(Vc, fasor, I, Y, pvpq, pq):
+        """
+        Monta a Jacobiana reduzida (linhas/colunas de θ em PV+PQ e de V em PQ)
+        a partir dos mesmos fasores usados no cálculo do mismatch.
+        """
+        diag_Vc = sp.diags(Vc)
+        dS_dtheta = 1j * diag_Vc @ (sp.diags(I) - Y @ diag_Vc).conj()
+        dS_dV = diag_Vc @ (Y @ sp.diags(fasor)).conj() + sp.diags(np.conj(I) * fasor)
+
+        dS_dtheta = dS_dtheta.tocsr()
+        dS_dV = dS_dV.tocsr()
+
+        H = dS_dtheta[pvpq][:, pvpq].real
+        N = dS_dV[pvpq][:, pq].real
+        M = dS_dtheta[pq][:, pvpq].imag
+        L = dS_dV[pq][:, pq].imag
+
+        return sp.bmat([[H, N], [M, L]], format="csc")
+
+    @staticmethod
+    def _estado_inicial(dados_barras):
+        """
+        Lê as injeções especificadas e o estado inicial (V em pu, θ em radianos)
+        das barras. Grandezas não informadas partem de P = Q = 0, V = 1 e θ = 0.
+        """
         P = np.array(
             [
                 barra["P (PU)"] if barra["P (PU)"] is not None else 0.0
@@ -73,177 +232,927 @@ class Flupot:
         )
         V = np.array(
             [
-                barra["V (PU)"] if barra["V (PU)"] is not None else 0.0
+                barra["V (PU)"] if barra["V (PU)"] is not None else 1.0
                 for barra in dados_barras
             ]
         )
-        theta = np.array(
+        theta = np.radians(
             [
                 barra["θ (graus)"] if barra["θ (graus)"] is not None else 0.0
                 for barra in dados_barras
             ]
         )
 
-        # Encontrando o ângulo de referência
-        theta_ref = next(
-            barra["θ (graus)"] for barra in dados_barras if barra["TIPO"] == "SLACK"
-        )
-        theta = np.append(theta, theta_ref)
+        return P, Q, V, theta
 
-        num_barras = len(P)
+    @staticmethod
+    def _aplicar_estado_inicial(V, theta, estado_inicial, pvpq, pq):
+        """
+        Substitui o estado inicial das incógnitas (θ em PV+PQ e V em PQ) por um
+        estado anterior (V, θ), mantendo os valores especificados das demais.
+        """
+        if estado_inicial is None:
+            return
+        V0, theta0 = estado_inicial
+        if len(V0) != len(V) or len(theta0) != len(theta):
+            raise ValueError("O estado inicial não corresponde ao número de barras.")
+        theta[pvpq] = np.asarray(theta0)[pvpq]
+        V[pq] = np.asarray(V0)[pq]
+
+    def _gravar_resultados(self, dados_barras, dados_linhas, V, theta, Y, ref, pq):
+        """
+        Escreve nas barras e linhas o estado da rede e os fluxos resultantes.
+        """
+        # Potências das barras de referência e PV resultam da solução.
+        _, _, _, S = self._potencias(V, theta, Y)
+        teta_graus = np.degrees(theta)
 
-        # Inicializando a matriz Y
-        Y = np.zeros((num_barras, num_barras), dtype=complex)
+        for i, barra in enumerate(dados_barras):
+            barra["V (PU)"] = round(V[i], 2)
+            barra["θ (graus)"] = round(teta_graus[i], 2)
+            if i not in pq:
+                barra["Q (PU)"] = round(S[i].imag, 2)
+            if i in ref:
+                barra["P (PU)"] = round(S[i].real, 2)
 
-        # Construindo a matriz de admitância
+        Vc = V * np.exp(1j * theta)
         for linha in dados_linhas:
             i = linha["DE"] - 1
             j = linha["PARA"] - 1
-            r = linha["r"]
-            x = linha["x"]
-            b = linha["b"]
-
-            z = complex(r, x)
-            y = 1 / z
-            b_shunt = complex(0, b / 2)
-
-            Y[i, j] -= y
-            Y[j, i] -= y
-            Y[i, i] += y + b_shunt
-            Y[j, j] += y + b_shunt
-
-        # Separando G e B
-        G = np.real(Y)
-        B = np.imag(Y)
-
-        def mismatch(P, Q, V, theta, num_barras, G, B):
-            P_calc = np.zeros(num_barras)
-            Q_calc = np.zeros(num_barras)
-
-            for i in range(num_barras):
-                for j in range(num_barras):
-                    P_calc[i] += (
-                        V[i]
-                        * V[j]
-                        * (
-                            G[i, j] * np.cos(theta[i] - theta[j])
-                            + B[i, j] * np.sin(theta[i] - theta[j])
-                        )
-                    )
-                    Q_calc[i] += (
-                        V[i]
-                        * V[j]
-                        * (
-                            G[i, j] * np.sin(theta[i] - theta[j])
-                            - B[i, j] * np.cos(theta[i] - theta[j])
-                        )
+
+            y = 1 / complex(linha["r"], linha["x"])
+            b_shunt = complex(0, linha["b"] / 2)
+
+            Iij = (Vc[i] - Vc[j]) * y + Vc[i] * b_shunt
+            Sij = Vc[i] * np.conj(Iij)
+
+            linha["POTENCIA (PU)"] = round(Sij.real, 2) + round(Sij.imag, 2) * 1j
+
+    def newton_raphson(
+        self,
+        dados_barras,
+        dados_linhas,
+        tol=1e-3,
+        lim_iter=50,
+        estado_inicial=None,
+        jacobiano="sempre",
+        intervalo_jacobiano=5,
+        razao_estagnacao=0.5,
+        admitancia=None,
+    ):
+        """
+        Fluxo de potência pelo método de Newton-Raphson. `estado_inicial` é um
+        par (V, θ) de uma solução anterior (θ em radianos), usado como ponto de
+        partida no lugar dos dados das barras.
+
+        `jacobiano` define quando a Jacobiana é remontada e refatorada:
+        - "sempre": a cada iteração (Newton completo);
+        - "adaptativo": a fatoração é reutilizada até que o mismatch deixe de
+          cair pelo fator `razao_estagnacao` entre iterações ou até completar
+          `intervalo_jacobiano` iterações (Newton "desonesto");
+        - "shamanskii": refatora a cada `intervalo_jacobiano` iterações;
+        - "corda": fatora apenas no ponto inicial.
+        O número de fatorações fica em `self.fatoracoes`.
+
+        `admitancia` é uma Ybus já montada para `dados_linhas` (por exemplo,
+        compartilhada entre os cenários de um lote); se omitida, é montada.
+        """
+        if jacobiano not in ("sempre", "adaptativo", "shamanskii", "corda"):
+            raise ValueError(
+                f"Modo de atualização da Jacobiana desconhecido: {jacobiano}"
+            )
+
+        P, Q, V, theta = self._estado_inicial(dados_barras)
+
+        num_barras = len(P)
+        ref, pv, pq = self.classificar_barras(dados_barras)
+        pvpq = np.concatenate([pv, pq])
+        num_pvpq = len(pvpq)
+        self._aplicar_estado_inicial(V, theta, estado_inicial, pvpq, pq)
+
+        Y = admitancia
+        if Y is None:
+            Y = self.matriz_admitancia(dados_linhas, num_barras)
+
+        resolver = None
+        idade = 0  # Iterações desde a última fatoração
+        norma_anterior = np.inf
+        self.fatoracoes = 0
+
+        iteracoes = 0
+        convergencia = False
+        while iteracoes < lim_iter:
+            Vc, fasor, I, S = self._potencias(V, theta, Y)
+            deltaP = P[pvpq] - S.real[pvpq]
+            deltaQ = Q[pq] - S.imag[pq]
+            mismatch = np.concatenate([deltaP, deltaQ])
+            norma = np.max(np.abs(mismatch))
+
+            if norma < tol:
+                convergencia = True
+                break
+
+            if (
+                resolver is None
+                or jacobiano == "sempre"
+                or (jacobiano == "shamanskii" and idade >= intervalo_jacobiano)
+                or (
+                    jacobiano == "adaptativo"
+                    and (
+                        idade >= intervalo_jacobiano
+                        or norma > razao_estagnacao * norma_anterior
                     )
+                )
+            ):
+                J = self._jacobiano(Vc, fasor, I, Y, pvpq, pq)
+                resolver = self._fatorar(J, self.ordenacao)
+                idade = 0
+                self.fatoracoes += 1
 
-            deltaP = P - P_calc
-            deltaQ = Q - Q_calc
-            return deltaP, deltaQ
-
-        def jacobiano(V, theta, G, B):
-            n = len(V)
-            H = np.zeros((n, n))
-            N = np.zeros((n, n))
-            M = np.zeros((n, n))
-            L = np.zeros((n, n))
-
-            for i in range(n):
-                for j in range(n):
-                    if i == j:
-                        for k in range(n):
-                            if k != i:
-                                H[i, i] += (
-                                    V[i]
-                                    * V[k]
-                                    * (
-                                        -G[i, k] * np.sin(theta[i] - theta[k])
-                                        + B[i, k] * np.cos(theta[i] - theta[k])
-                                    )
-                                )
-                                N[i, i] += V[k] * (
-                                    G[i, k] * np.cos(theta[i] - theta[k])
-                                    + B[i, k] * np.sin(theta[i] - theta[k])
-                                )
-                                M[i, i] -= (
-                                    V[i]
-                                    * V[k]
-                                    * (
-                                        G[i, k] * np.cos(theta[i] - theta[k])
-                                        + B[i, k] * np.sin(theta[i] - theta[k])
-                                    )
-                                )
-                                L[i, i] -= V[k] * (
-                                    G[i, k] * np.sin(theta[i] - theta[k])
-                                    - B[i, k] * np.cos(theta[i] - theta[k])
-                                )
-                        H[i, i] += V[i] ** 2 * B[i, i]
-                        L[i, i] += V[i] ** 2 * B[i, i]
-                    else:
-                        H[i, j] = (
-                            V[i]
-                            * V[j]
-                            * (
-                                G[i, j] * np.sin(theta[i] - theta[j])
-                                - B[i, j] * np.cos(theta[i] - theta[j])
-                            )
-                        )
-                        N[i, j] = V[i] * (
-                            G[i, j] * np.cos(theta[i] - theta[j])
-                            + B[i, j] * np.sin(theta[i] - theta[j])
-                        )
-                        M[i, j] = (
-                            -V[i]
-                            * V[j]
-                            * (
-                                G[i, j] * np.cos(theta[i] - theta[j])
-                                + B[i, j] * np.sin(theta[i] - theta[j])
-                            )
-                        )
-                        L[i, j] = V[i] * (
-                            G[i, j] * np.sin(theta[i] - theta[j])
-                            - B[i, j] * np.cos(theta[i] - theta[j])
-                        )
+            delta = resolver(mismatch)
+            idade += 1
+            norma_anterior = norma
 
-            # Construir a matriz Jacobiana
-            J = np.block([[H, N], [M, L]])
+            theta[pvpq] += delta[:num_pvpq]
+            V[pq] += delta[num_pvpq:]
+            iteracoes += 1
 
-            return J
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
 
-        tol = 1e-3
-        converge = False
-        while not converge:
-            deltaP, deltaQ = mismatch(P, Q, V, theta, num_barras, G, B)
+        self.estado = (V.copy(), theta.copy())
+        self.convergiu = convergencia
+        self.iteracoes = iteracoes
+        self._gravar_resultados(dados_barras, dados_linhas, V, theta, Y, ref, pq)
 
-            if np.max(np.abs(deltaP)) < tol and np.max(np.abs(deltaQ)) < tol:
-                converge = True
+        return {"BARRAS": dados_barras, "LINHAS": dados_linhas}
 
-            J = jacobiano(V, theta, G, B)
+    def desacoplado_rapido(
+        self, dados_barras, dados_linhas, tol=1e-3, lim_iter=50, estado_inicial=None
+    ):
+        """
+        Fluxo de potência desacoplado rápido (versão XB). As matrizes B' (1/x,
+        barras PV+PQ) e B'' (-Im(Ybus), barras PQ) são constantes: são montadas
+        e fatoradas uma única vez, e cada meia-iteração P-θ/Q-V exige apenas
+        substituições progressiva e regressiva. `estado_inicial` tem o mesmo
+        significado que em `newton_raphson`.
+        """
+        P, Q, V, theta = self._estado_inicial(dados_barras)
 
-            delta_theta, delta_V = np.linalg.solve(J, np.concatenate([deltaP, deltaQ]))
+        num_barras = len(P)
+        ref, pv, pq = self.classificar_barras(dados_barras)
+        pvpq = np.concatenate([pv, pq])
+        self._aplicar_estado_inicial(V, theta, estado_inicial, pvpq, pq)
 
-            theta[:num_barras] += delta_theta
-            V[:num_barras] += delta_V
+        Y = self.matriz_admitancia(dados_linhas, num_barras)
+        B1 = self.matriz_susceptancia(dados_linhas, num_barras)
+        B2 = -Y.imag
 
-            if np.max(np.abs(delta_theta)) < tol and np.max(np.abs(delta_V)) < tol:
-                converge = True
+        resolver_B1 = self._fatorar(B1[pvpq][:, pvpq], self.ordenacao)
+        resolver_B2 = self._fatorar(B2[pq][:, pq], self.ordenacao) if len(pq) else None
 
-        for i, barra in enumerate(dados_barras):
-            barra["V (PU)"] = round(V[i], 2)
-            barra["θ (graus)"] = round(theta[i], 2)
+        iteracoes = 0
+        convergencia = False
+        while iteracoes < lim_iter:
+            # Meia-iteração P-θ
+            _, _, _, S = self._potencias(V, theta, Y)
+            deltaP = P[pvpq] - S.real[pvpq]
+            deltaQ = Q[pq] - S.imag[pq]
 
-        for linha in dados_linhas:
-            i = linha["DE"] - 1
-            j = linha["PARA"] - 1
+            if max(np.max(np.abs(deltaP)), np.max(np.abs(deltaQ), initial=0.0)) < tol:
+                convergencia = True
+                break
 
-            Vi = V[i] * np.exp(1j * np.radians(theta[i]))
-            Vj = V[j] * np.exp(1j * np.radians(theta[j]))
+            theta[pvpq] += resolver_B1(deltaP / V[pvpq])
 
-            Iij = (Vi - Vj) * Y[i, j]
-            Sij = Vi * np.conj(Iij)
+            # Meia-iteração Q-V
+            if len(pq):
+                _, _, _, S = self._potencias(V, theta, Y)
+                deltaQ = Q[pq] - S.imag[pq]
+                V[pq] += resolver_B2(deltaQ / V[pq])
 
-            linha["POTENCIA (PU)"] = round(Sij.real, 2) + round(Sij.imag, 2) * 1j
+            iteracoes += 1
+
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+
+        self.estado = (V.copy(), theta.copy())
+        self.convergiu = convergencia
+        self.iteracoes = iteracoes
+        self._gravar_resultados(dados_barras, dados_linhas, V, theta, Y, ref, pq)
 
         return {"BARRAS": dados_barras, "LINHAS": dados_linhas}
+
+    @staticmethod
+    def _limites(dados_linhas, limites):
+        """
+        Limites de carregamento dos ramos (pu): um escalar, uma sequência por
+        ramo ou, se omitidos, o campo opcional "LIMITE (PU)" das linhas.
+        Ramos sem limite não são verificados.
+        """
+        if limites is None:
+            limites = [linha.get("LIMITE (PU)") for linha in dados_linhas]
+        limites = np.broadcast_to(np.array(limites, dtype=object), (len(dados_linhas),))
+        return np.array([np.inf if l is None else l for l in limites], dtype=float)
+
+    @staticmethod
+    def _admitancia_ramo(linha, num_barras):
+        """
+        Contribuição de um único ramo para a Ybus (no máximo quatro entradas),
+        usada para desligá-lo sem remontar a matriz.
+        """
+        i = linha["DE"] - 1
+        j = linha["PARA"] - 1
+        y = 1 / complex(linha["r"], linha["x"])
+        b_shunt = 1j * linha["b"] / 2
+        return sp.coo_matrix(
+            ([-y, -y, y + b_shunt, y + b_shunt], ([i, j, i, j], [j, i, i, j])),
+            shape=(num_barras, num_barras),
+        ).tocsr()
+
+    @staticmethod
+    def _fluxos_ramos(Vc, dados_linhas):
+        """
+        Potência complexa (pu) que sai da barra de origem de cada ramo.
+        """
+        de = np.array([linha["DE"] - 1 for linha in dados_linhas], dtype=int)
+        para = np.array([linha["PARA"] - 1 for linha in dados_linhas], dtype=int)
+        r = np.array([linha["r"] for linha in dados_linhas], dtype=float)
+        x = np.array([linha["x"] for linha in dados_linhas], dtype=float)
+        b = np.array([linha["b"] for linha in dados_linhas], dtype=float)
+
+        Iij = (Vc[de] - Vc[para]) / (r + 1j * x) + Vc[de] * 1j * b / 2
+        return Vc[de] * np.conj(Iij)
+
+    def contingencias(
+        self,
+        dados_barras,
+        dados_linhas,
+        modelo="dc",
+        limites=None,
+        tol=1e-3,
+        lim_iter=10,
+    ):
+        """
+        Análise de contingências N-1: cada ramo de `dados_linhas` é desligado
+        por vez e são informados o fluxo pós-contingência e os ramos
+        sobrecarregados. Nenhuma matriz é remontada ou refatorada por
+        contingência:
+        - "dc": fluxos obtidos do caso base pelas LODF do `ModeloDC`
+          (atualização de posto 1 de Sherman-Morrison em forma fechada);
+        - "ac": parte da solução base de `newton_raphson`; a Jacobiana base
+          fatorada é corrigida pela fórmula de Woodbury (o ramo altera no
+          máximo quatro equações) e são feitas até `lim_iter` iterações de
+          corda sobre a Ybus sem o ramo.
+        Os fluxos pós-contingência (ramos x contingências) ficam em
+        `self.fluxos_contingencia`.
+        """
+        if modelo not in ("dc", "ac"):
+            raise ValueError(f"Modelo de contingência desconhecido: {modelo}")
+
+        limites = self._limites(dados_linhas, limites)
+        if modelo == "dc":
+            modelo_dc = ModeloDC(dados_barras, dados_linhas)
+            fluxos = modelo_dc.contingencias(modelo_dc.injecoes(dados_barras))
+            convergiu = ~np.isnan(fluxos).any(axis=0)
+        else:
+            fluxos, convergiu = self._contingencias_ac(
+                dados_barras, dados_linhas, tol, lim_iter
+            )
+        self.fluxos_contingencia = fluxos
+
+        relatorio = []
+        for k, linha in enumerate(dados_linhas):
+            carregamento = np.abs(fluxos[:, k])
+            sobrecargas = [
+                dados_linhas[l]["ID"]
+                for l in np.flatnonzero(carregamento > limites)
+                if l != k
+            ]
+            relatorio.append(
+                {
+                    "RAMO DESLIGADO": linha["ID"],
+                    "CONVERGIU": bool(convergiu[k]),
+                    "FLUXO MÁXIMO (PU)": round(float(np.nanmax(carregamento)), 2)
+                    if convergiu[k]
+                    else None,
+                    "SOBRECARGAS": sobrecargas,
+                }
+            )
+
+        return relatorio
+
+    def _contingencias_ac(self, dados_barras, dados_linhas, tol, lim_iter):
+        """
+        Triagem AC das contingências N-1 a partir da solução base, usando a
+        Jacobiana base fatorada uma única vez com correções de Woodbury.
+        """
+        P, Q, _, _ = self._estado_inicial(dados_barras)
+        num_barras = len(P)
+        ref, pv, pq = self.classificar_barras(dados_barras)
+        pvpq = np.concatenate([pv, pq])
+        num_pvpq = len(pvpq)
+
+        # Caso base (os dados originais não são alterados)
+        self.newton_raphson(
+            copy.deepcopy(dados_barras), copy.deepcopy(dados_linhas), tol=tol
+        )
+        if not self.convergiu:
+            raise ValueError(
+                "O caso base não convergiu; a triagem AC de contingências "
+                "não pode partir dele."
+            )
+        V0, theta0 = self.estado
+
+        Y = self.matriz_admitancia(dados_linhas, num_barras)
+        Vc0, fasor0, I0, _ = self._potencias(V0, theta0, Y)
+        J = self._jacobiano(Vc0, fasor0, I0, Y, pvpq, pq)
+        resolver = self._fatorar(J, self.ordenacao)
+
+        fluxos = np.full((len(dados_linhas), len(dados_linhas)), np.nan, dtype=complex)
+        convergiu = np.zeros(len(dados_linhas), dtype=bool)
+
+        for k, linha in enumerate(dados_linhas):
+            dY = self._admitancia_ramo(linha, num_barras)
+            Yk = Y - dY
+
+            # J_k = J_0 - U W, com U selecionando as equações alteradas pelo ramo
+            dJ = self._jacobiano(Vc0, fasor0, dY @ Vc0, dY, pvpq, pq).tocsr()
+            afetadas = np.unique(dJ.tocoo().row)
+            W = dJ[afetadas].toarray()
+            U = np.zeros((dJ.shape[0], len(afetadas)))
+            U[afetadas, np.arange(len(afetadas))] = 1.0
+            Z = resolver(U)
+            capacitancia = np.eye(len(afetadas)) - W @ Z
+            if np.linalg.cond(capacitancia) > 1e12:
+                # O desligamento ilha parte do sistema
+                continue
+
+            V, theta = V0.copy(), theta0.copy()
+            for _ in range(lim_iter + 1):
+                Vc, _, _, S = self._potencias(V, theta, Yk)
+                mismatch = np.concatenate([P[pvpq] - S.real[pvpq], Q[pq] - S.imag[pq]])
+                if np.max(np.abs(mismatch)) < tol:
+                    convergiu[k] = True
+                    break
+                y = resolver(mismatch)
+                delta = y + Z @ np.linalg.solve(capacitancia, W @ y)
+                theta[pvpq] += delta[:num_pvpq]
+                V[pq] += delta[num_pvpq:]
+
+            if convergiu[k]:
+                fluxos[:, k] = self._fluxos_ramos(Vc, dados_linhas)
+                fluxos[k, k] = 0.0
+
+        return fluxos, convergiu
+
+
+class ModeloDC:
+    """
+    Modelo linearizado (DC) de uma topologia fixa. A matriz B reduzida é
+    montada e fatorada uma única vez, e as matrizes de sensibilidade PTDF
+    (fluxo nos ramos por injeção nas barras) e LODF (redistribuição do fluxo
+    de um ramo desligado) ficam pré-calculadas. Cada novo vetor de injeções
+    (ou bloco n x k de injeções) é resolvido por um produto de matrizes.
+    Uma topologia base ilhada (B' singular) gera ValueError.
+    """
+
+    def __init__(self, dados_barras, dados_linhas):
+        self.n = len(dados_barras)
+        self.m = len(dados_linhas)
+
+        ref, _, _ = Flupot().classificar_barras(dados_barras)
+        self.ref = int(ref[0])
+        self.nao_ref = np.array([i for i in range(self.n) if i != self.ref], dtype=int)
+        self.theta_ref = np.radians(dados_barras[self.ref]["θ (graus)"] or 0.0)
+
+        self.de = np.array([linha["DE"] - 1 for linha in dados_linhas], dtype=int)
+        self.para = np.array([linha["PARA"] - 1 for linha in dados_linhas], dtype=int)
+        self.susceptancia = 1 / np.array(
+            [linha["x"] for linha in dados_linhas], dtype=float
+        )
+
+        # Incidência ramo-barra (+1 na origem, -1 no destino) e Bf = diag(1/x) A
+        ramos = np.arange(self.m)
+        self.incidencia = sp.coo_matrix(
+            (
+                np.concatenate([np.ones(self.m), -np.ones(self.m)]),
+                (np.concatenate([ramos, ramos]), np.concatenate([self.de, self.para])),
+            ),
+            shape=(self.m, self.n),
+        ).tocsr()
+        self.Bf = sp.diags(self.susceptancia) @ self.incidencia
+
+        B = Flupot().matriz_susceptancia(dados_linhas, self.n)
+        Flupot._verificar_ilhamento(B)
+        B_reduzida = B[self.nao_ref][:, self.nao_ref]
+        resolver = Flupot._fatorar(B_reduzida)
+
+        # Sensibilidade dos ângulos às injeções (linha e coluna da referência
+        # nulas)
+        self.sensibilidade = np.zeros((self.n, self.n))
+        self.sensibilidade[np.ix_(self.nao_ref, self.nao_ref)] = resolver(
+            np.eye(len(self.nao_ref))
+        )
+
+        self.ptdf = self.Bf @ self.sensibilidade
+        self.lodf = self._calcular_lodf()
+
+    def _calcular_lodf(self):
+        """
+        LODF[l, k] é a fração do fluxo pré-contingência do ramo k que passa
+        para o ramo l quando k é desligado. Ramos cuja saída ilha o sistema
+        (1 - PTDF_kk = 0) têm a coluna marcada com NaN.
+        """
+        H = np.asarray(self.incidencia @ self.ptdf.T).T
+        denominador = 1 - np.diag(H)
+        ilhamento = np.abs(denominador) < 1e-10
+        denominador[ilhamento] = np.nan
+
+        lodf = H / denominador
+        lodf[np.arange(self.m), np.arange(self.m)] = -1.0
+        lodf[:, ilhamento] = np.nan
+        return lodf
+
+    @staticmethod
+    def injecoes(dados_barras):
+        """
+        Vetor de injeções líquidas de potência ativa (pu); valores ausentes
+        contam como zero.
+        """
+        return np.array([barra["P (PU)"] or 0.0 for barra in dados_barras], dtype=float)
+
+    def angulos(self, P):
+        """
+        Ângulos das barras (radianos) para um vetor de injeções de tamanho n
+        ou um bloco n x k (uma coluna por padrão de injeção).
+        """
+        return self.sensibilidade @ np.asarray(P, dtype=float) + self.theta_ref
+
+    def fluxos(self, P):
+        """
+        Fluxos de potência ativa (pu) em todos os ramos para um vetor de
+        injeções de tamanho n ou um bloco n x k.
+        """
+        return self.ptdf @ np.asarray(P, dtype=float)
+
+    def resolver(self, P):
+        """
+        Retorna (ângulos, fluxos) para as injeções fornecidas.
+        """
+        return self.angulos(P), self.fluxos(P)
+
+    def contingencias(self, P):
+        """
+        Fluxos pós-contingência N-1 (ramos x contingências): a coluna k traz
+        os fluxos com o ramo k desligado, F_l + LODF[l, k] F_k. Colunas de
+        desligamentos que ilham o sistema ficam com NaN.
+        """
+        F = self.fluxos(P)
+        fluxos = F[:, None] + self.lodf * F[None, :]
+        fluxos[np.arange(self.m), np.arange(self.m)] = 0.0
+        fluxos[:, np.isnan(self.lodf).any(axis=0)] = np.nan
+        return fluxos
+
+
+# Estado de cada processo do lote: Ybus base (em memória compartilhada) e dados
+# do caso base, recebidos uma única vez na inicialização do processo.
+_LOTE = {}
+
+
+def _iniciar_lote(blocos, forma, dados_barras, dados_linhas, opcoes):
+    """
+    Inicializa um processo do lote, anexando a Ybus base compartilhada.
+    """
+    memorias = [shared_memory.SharedMemory(name=nome) for nome, _, _ in blocos]
+    arrays = [
+        np.ndarray((tamanho,), dtype=tipo, buffer=memoria.buf)
+        for memoria, (_, tipo, tamanho) in zip(memorias, blocos)
+    ]
+    _LOTE.update(
+        memorias=memorias,
+        Y=sp.csr_matrix(tuple(arrays), shape=forma),
+        barras=dados_barras,
+        linhas=dados_linhas,
+        opcoes=opcoes,
+    )
+    # As mensagens de convergência de cada cenário não são exibidas.
+    sys.stdout = open(os.devnull, "w")
+
+
+def _resolver_cenario(indice, cenario):
+    """
+    Resolve um cenário sobre o caso base do processo. `cenario` traz as
+    alterações das barras por ID ({"BARRAS": {ID: {campo: valor}}}) e os IDs
+    dos ramos desligados ({"LINHAS DESLIGADAS": [...]}).
+    """
+    flupot = Flupot()
+    dados_barras = copy.deepcopy(_LOTE["barras"])
+    alteracoes = cenario.get("BARRAS", {})
+    for barra in dados_barras:
+        barra.update(alteracoes.get(barra["ID"], {}))
+
+    # Ramos desligados são retirados da Ybus base sem remontá-la.
+    desligadas = set(cenario.get("LINHAS DESLIGADAS", ()))
+    Y = _LOTE["Y"]
+    dados_linhas = []
+    for linha in copy.deepcopy(_LOTE["linhas"]):
+        if linha["ID"] in desligadas:
+            Y = Y - flupot._admitancia_ramo(linha, len(dados_barras))
+        else:
+            dados_linhas.append(linha)
+
+    resultado = flupot.newton_raphson(
+        dados_barras, dados_linhas, admitancia=Y, **_LOTE["opcoes"]
+    )
+    resultado["CONVERGIU"] = flupot.convergiu
+    resultado["ITERACOES"] = flupot.iteracoes
+    return indice, resultado
+
+
+class LoteFlupot:
+    """
+    Executa em lote fluxos de potência (Newton-Raphson) de vários cenários
+    sobre um mesmo caso base, distribuídos em um pool de processos. A Ybus
+    base é colocada em memória compartilhada e os dados do caso base são
+    enviados uma vez por processo; cada tarefa transporta apenas o cenário.
+    """
+
+    def __init__(self, dados_barras, dados_linhas, processos=None, **opcoes):
+        self.dados_barras = dados_barras
+        self.dados_linhas = dados_linhas
+        self.processos = processos or os.cpu_count()
+        self.opcoes = opcoes
+
+    def executar(self, cenarios):
+        """
+        Resolve os cenários (iterável de dicionários, ver `_resolver_cenario`)
+        e devolve pares (índice do cenário, resultado) à medida que terminam,
+        fora de ordem. O número de tarefas pendentes é limitado, de modo que
+        `cenarios` pode ser um gerador arbitrariamente longo.
+        """
+        Y = Flupot().matriz_admitancia(self.dados_linhas, len(self.dados_barras))
+
+        memorias = []
+        blocos = []
+        try:
+            for array in (Y.data, Y.indices, Y.indptr):
+                memoria = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1)
+                )
+                copia = np.ndarray(array.shape, dtype=array.dtype, buffer=memoria.buf)
+                copia[:] = array
+                memorias.append(memoria)
+                blocos.append((memoria.name, array.dtype.str, array.size))
+
+            with ProcessPoolExecutor(
+                max_workers=self.processos,
+                initializer=_iniciar_lote,
+                initargs=(
+                    blocos,
+                    Y.shape,
+                    self.dados_barras,
+                    self.dados_linhas,
+                    self.opcoes,
+                ),
+            ) as pool:
+                pendentes = set()
+                for indice, cenario in enumerate(cenarios):
+                    pendentes.add(pool.submit(_resolver_cenario, indice, cenario))
+                    if len(pendentes) >= 4 * self.processos:
+                        prontas, pendentes = wait(
+                            pendentes, return_when=FIRST_COMPLETED
+                        )
+                        for futura in prontas:
+                            yield futura.result()
+
+                while pendentes:
+                    prontas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futura in prontas:
+                        yield futura.result()
+        finally:
+            for memoria in memorias:
+                memoria.close()
+                memoria.unlink()
+
+
+class ModeloRede:
+    """
+    Modelo persistente da rede para estudos de manobra: a Ybus e a matriz B
+    (1/x) são montadas uma vez em CSR, com a estrutura de todos os ramos, e
+    atualizadas somando ou retirando a estampa de cada ramo diretamente nas
+    posições pré-calculadas de `.data`, sem remontagem nem conversão. Abrir,
+    fechar ou alterar um ramo custa O(1) e marca como desatualizada a
+    fatoração de B', refeita apenas quando usada.
+    """
+
+    def __init__(self, dados_barras, dados_linhas):
+        self.dados_barras = dados_barras
+        self.n = len(dados_barras)
+        self.linhas = {linha["ID"]: dict(linha) for linha in dados_linhas}
+        self.indices = {id_linha: k for k, id_linha in enumerate(self.linhas)}
+        self.ativas = {id_linha: True for id_linha in self.linhas}
+
+        ref, pv, pq = Flupot().classificar_barras(dados_barras)
+        self.nao_ref = np.concatenate([pv, pq])
+
+        # Estrutura fixa: posições (ij, ji, ii, jj) de cada ramo em `.data`.
+        de = np.array([linha["DE"] - 1 for linha in dados_linhas], dtype=np.int64)
+        para = np.array([linha["PARA"] - 1 for linha in dados_linhas], dtype=np.int64)
+        linhas = np.stack([de, para, de, para], axis=1)
+        colunas = np.stack([para, de, de, para], axis=1)
+        chaves = linhas * self.n + colunas
+        unicas = np.unique(chaves)
+        indptr = np.searchsorted(unicas // self.n, np.arange(self.n + 1))
+        indices = unicas % self.n
+        self.posicoes = np.searchsorted(unicas, chaves)
+
+        self.Y = sp.csr_matrix(
+            (np.zeros(len(unicas), dtype=complex), indices, indptr),
+            shape=(self.n, self.n),
+        )
+        self.B = sp.csr_matrix(
+            (np.zeros(len(unicas)), indices.copy(), indptr.copy()),
+            shape=(self.n, self.n),
+        )
+        self.fatoracoes = {}
+
+        # Estampa inicial de todos os ramos, vetorizada.
+        r = np.array([linha["r"] for linha in dados_linhas], dtype=float)
+        x = np.array([linha["x"] for linha in dados_linhas], dtype=float)
+        b = np.array([linha["b"] for linha in dados_linhas], dtype=float)
+        np.add.at(self.Y.data, self.posicoes, self._estampa_Y(r, x, b))
+        np.add.at(self.B.data, self.posicoes, self._estampa_B(x))
+
+    @staticmethod
+    def _estampa_Y(r, x, b):
+        """
+        Contribuições (ij, ji, ii, jj) de um ou mais ramos para a Ybus.
+        """
+        y = 1 / (r + 1j * x)
+        b_shunt = 1j * b / 2
+        return np.stack([-y, -y, y + b_shunt, y + b_shunt], axis=-1)
+
+    @staticmethod
+    def _estampa_B(x):
+        """
+        Contribuições (ij, ji, ii, jj) de um ou mais ramos para B.
+        """
+        susceptancia = 1 / x
+        return np.stack(
+            [-susceptancia, -susceptancia, susceptancia, susceptancia], axis=-1
+        )
+
+    def _estampar(self, id_linha, sinal, matrizes=("Y", "B")):
+        """
+        Soma (sinal = 1) ou retira (sinal = -1) a contribuição de um ramo da
+        Ybus e/ou de B, nas posições fixas do ramo.
+        """
+        linha = self.linhas[id_linha]
+        posicoes = self.posicoes[self.indices[id_linha]]
+
+        if "Y" in matrizes:
+            self.Y.data[posicoes] += sinal * self._estampa_Y(
+                linha["r"], linha["x"], linha["b"]
+            )
+
+        if "B" in matrizes:
+            self.B.data[posicoes] += sinal * self._estampa_B(linha["x"])
+            self.fatoracoes.pop("B1", None)
+
+    def desatualizadas(self):
+        """
+        Fatorações que precisam ser refeitas antes do próximo uso
+        ("B1" = B' nas barras PV+PQ).
+        """
+        return {nome for nome in ("B1",) if nome not in self.fatoracoes}
+
+    def abrir_linha(self, id_linha):
+        """
+        Desliga o ramo `id_linha`, retirando sua estampa das matrizes.
+        """
+        if self.ativas[id_linha]:
+            self._estampar(id_linha, -1)
+            self.ativas[id_linha] = False
+
+    def fechar_linha(self, id_linha):
+        """
+        Religa o ramo `id_linha`, somando sua estampa às matrizes.
+        """
+        if not self.ativas[id_linha]:
+            self._estampar(id_linha, 1)
+            self.ativas[id_linha] = True
+
+    def alterar_parametros(self, id_linha, r=None, x=None, b=None):
+        """
+        Altera os parâmetros r, x e/ou b do ramo, trocando sua estampa antiga
+        pela nova se ele estiver ligado.
+        """
+        linha = self.linhas[id_linha]
+        # B depende apenas de x
+        matrizes = ("Y", "B") if x is not None else ("Y",)
+        ativa = self.ativas[id_linha]
+        if ativa:
+            self._estampar(id_linha, -1, matrizes)
+        for campo, valor in (("r", r), ("x", x), ("b", b)):
+            if valor is not None:
+                linha[campo] = valor
+        if ativa:
+            self._estampar(id_linha, 1, matrizes)
+
+    def linhas_ativas(self):
+        """
+        Dados dos ramos ligados, no formato de `dados_linhas`.
+        """
+        return [
+            linha for id_linha, linha in self.linhas.items() if self.ativas[id_linha]
+        ]
+
+    def admitancia(self):
+        """
+        Ybus atual em CSR. É a própria matriz mantida pelo modelo: manobras
+        posteriores a alteram.
+        """
+        return self.Y
+
+    def susceptancia(self):
+        """
+        Matriz B atual em CSR (a própria matriz mantida pelo modelo).
+        """
+        return self.B
+
+    def fatoracao_B1(self):
+        """
+        Fatoração de B' (B nas barras PV+PQ), refeita apenas se algum x mudou
+        ou algum ramo foi manobrado desde a última chamada.
+        """
+        if "B1" not in self.fatoracoes:
+            B = self.susceptancia()
+            self.fatoracoes["B1"] = Flupot._fatorar(B[self.nao_ref][:, self.nao_ref])
+        return self.fatoracoes["B1"]
+
+    def angulos_dc(self, P):
+        """
+        Ângulos (radianos) do modelo linearizado para as injeções P, com a
+        barra de referência em zero.
+        """
+        theta = np.zeros(self.n)
+        P = np.asarray(P, dtype=float)
+        theta[self.nao_ref] = self.fatoracao_B1()(P[self.nao_ref])
+        return theta
+
+    def newton_raphson(self, **opcoes):
+        """
+        Fluxo de potência de Newton-Raphson sobre a topologia atual, usando a
+        Ybus mantida pelo modelo em vez de remontá-la.
+        """
+        return Flupot().newton_raphson(
+            copy.deepcopy(self.dados_barras),
+            copy.deepcopy(self.linhas_ativas()),
+            admitancia=self.admitancia(),
+            **opcoes,
+        )
+
+
+class SessaoFlupot:
+    """
+    Sequência de fluxos de potência sobre a mesma rede (por exemplo, um estudo
+    em série temporal), em que cada solução parte automaticamente do último
+    estado convergido. Só as soluções iterativas convergidas (Newton-Raphson
+    e desacoplado rápido) são guardadas como ponto de partida.
+    """
+
+    # Métodos cuja solução convergida serve de estado inicial.
+    METODOS_CONVERGENTES = ("newton_raphson", "desacoplado_rapido")
+
+    def __init__(self, metodo="newton_raphson", **opcoes):
+        self.flupot = Flupot()
+        self.metodo = metodo
+        self.opcoes = opcoes
+        self.estado = None
+
+    def resolver(self, dados_barras, dados_linhas):
+        """
+        Resolve o caso com o método da sessão, partindo do último estado
+        convergido quando o número de barras é o mesmo.
+        """
+        estado = self.estado
+        if estado is not None and len(estado[0]) != len(dados_barras):
+            estado = None
+
+        metodo = getattr(self.flupot, self.metodo)
+        resultado = metodo(
+            dados_barras, dados_linhas, estado_inicial=estado, **self.opcoes
+        )
+
+        if self.metodo in self.METODOS_CONVERGENTES and self.flupot.convergiu:
+            self.estado = self.flupot.estado
+        return resultado
+
+    def reiniciar(self):
+        """
+        Descarta o estado guardado; a próxima solução parte dos dados.
+        """
+        self.estado = None
+
+
+# Prefixos das colunas dos perfis e campos das barras correspondentes.
+CAMPOS_PERFIL = {"P": "P (PU)", "Q": "Q (PU)"}
+
+
+class SerieTemporal:
+    """
+    Fluxo de potência quase-estático em série temporal. Os perfis de carga e
+    geração são lidos como um fluxo de linhas (uma por instante) e cada
+    instante é resolvido partindo do estado do instante anterior. Tensões e
+    fluxos são entregues um instante por vez e podem ser gravados em disco
+    incrementalmente, sem acumular os resultados na memória.
+
+    Cada linha dos perfis tem a coluna "INSTANTE" e colunas "P_<ID>" ou
+    "Q_<ID>" com a injeção da barra <ID> naquele instante.
+    """
+
+    def __init__(self, dados_barras, dados_linhas, metodo="newton_raphson", **opcoes):
+        self.dados_barras = dados_barras
+        self.dados_linhas = dados_linhas
+        self.sessao = SessaoFlupot(metodo, **opcoes)
+
+    def _colunas(self, cabecalho):
+        """
+        Associa cada coluna do perfil a (índice da barra, campo).
+        """
+        indices = {barra["ID"]: i for i, barra in enumerate(self.dados_barras)}
+        colunas = {}
+        for coluna in cabecalho:
+            if coluna == "INSTANTE":
+                continue
+            prefixo, _, id_barra = coluna.partition("_")
+            if prefixo not in CAMPOS_PERFIL:
+                raise ValueError(f"Coluna de perfil desconhecida: {coluna}")
+            id_barra = int(id_barra) if id_barra.isdigit() else id_barra
+            if id_barra not in indices:
+                raise ValueError(f"Barra inexistente no perfil: {coluna}")
+            colunas[coluna] = (indices[id_barra], CAMPOS_PERFIL[prefixo])
+        return colunas
+
+    def resolver(self, perfis):
+        """
+        Gerador que resolve cada linha de `perfis` (iterável de dicionários)
+        e devolve (instante, convergiu, V, θ em radianos, fluxos complexos
+        dos ramos) para cada instante.
+        """
+        colunas = None
+        for linha in perfis:
+            if colunas is None:
+                colunas = self._colunas(linha.keys())
+
+            dados_barras = copy.deepcopy(self.dados_barras)
+            dados_linhas = copy.deepcopy(self.dados_linhas)
+            for coluna, (i, campo) in colunas.items():
+                dados_barras[i][campo] = linha[coluna]
+
+            self.sessao.resolver(dados_barras, dados_linhas)
+            V, theta = self.sessao.flupot.estado
+            fluxos = Flupot._fluxos_ramos(V * np.exp(1j * theta), dados_linhas)
+
+            yield linha.get("INSTANTE"), self.sessao.flupot.convergiu, V, theta, fluxos
+
+    def executar(self, arquivo_perfis, arquivo_barras, arquivo_linhas, delimitador=","):
+        """
+        Lê os perfis de `arquivo_perfis` e grava, a cada instante, as tensões
+        das barras (V e θ em graus) em `arquivo_barras` e os fluxos P e Q dos
+        ramos em `arquivo_linhas`. Retorna o número de instantes resolvidos.
+        """
+        ids_barras = [barra["ID"] for barra in self.dados_barras]
+        ids_linhas = [linha["ID"] for linha in self.dados_linhas]
+        cabecalho_barras = (
+            ["INSTANTE", "CONVERGIU"]
+            + [f"V_{i}" for i in ids_barras]
+            + [f"θ_{i}" for i in ids_barras]
+        )
+        cabecalho_linhas = (
+            ["INSTANTE"]
+            + [f"P_{i}" for i in ids_linhas]
+            + [f"Q_{i}" for i in ids_linhas]
+        )
+
+        self.sessao.reiniciar()
+        passos = 0
+        with EscritorCSV(arquivo_barras, cabecalho_barras, delimitador) as barras, \
+                EscritorCSV(arquivo_linhas, cabecalho_linhas, delimitador) as linhas:
+            for instante, convergiu, V, theta, fluxos in self.resolver(
+                ler_csv_incremental(arquivo_perfis, delimitador)
+            ):
+                barras.escrever(
+                    [instante, convergiu, *V.tolist(), *np.degrees(theta).tolist()]
+                )
+                linhas.escrever(
+                    [instante, *fluxos.real.tolist(), *fluxos.imag.tolist()]
+                )
+                passos += 1
+
+        return passos
@@ -1,6 +1,244 @@
-from typing import List
+import math
+import operator
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from typing import List, Union
 
-from utils.algebra import Derivada, Matriz, Vetor
+import numpy as np
+
+from utils.algebra import (
+    Derivada,
+    Matriz,
+    MatrizCompacta,
+    MatrizEsparsa,
+    Ordenacao,
+    Vetor,
+)
+
+
+class FatoracaoLU:
+    """
+    Fatoração PA = LU com pivoteamento parcial, calculada uma única vez e
+    reutilizada para resolver vários sistemas com a mesma matriz A.
+
+    L e U são armazenadas de forma compacta em `LU`, uma lista com as linhas
+    na ordem dos pivôs: abaixo da diagonal ficam os multiplicadores de L
+    (diagonal unitária implícita) e, na diagonal e acima dela, os elementos de
+    U. A permutação de linhas é guardada como um vetor de índices.
+
+    Com `ordenar=True`, as variáveis são antes reordenadas simetricamente pelo
+    esquema de mínimo grau (Tinney 2), o que reduz o preenchimento em matrizes
+    esparsas de rede. Informar uma instância de `Ordenacao` em `ordenacao`
+    também ativa a reordenação, e a ordenação é reaproveitada do cache dessa
+    instância para a mesma topologia.
+    """
+
+    def __init__(
+        self,
+        matrizA: List[List[float]],
+        ordenar: bool = False,
+        ordenacao: Ordenacao = None,
+    ):
+        n = len(matrizA)
+        if ordenar or ordenacao is not None:
+            if ordenacao is None:
+                ordenacao = Ordenacao()
+            linhas_nz, colunas_nz = [], []
+            for i in range(n):
+                for j, valor in enumerate(matrizA[i]):
+                    if valor != 0:
+                        linhas_nz.append(i)
+                        colunas_nz.append(j)
+            ordem = ordenacao.minimo_grau(n, linhas_nz, colunas_nz)
+            LU = [[matrizA[i][j] for j in ordem] for i in ordem]
+        else:
+            ordem = None
+            LU = Matriz.clone(matrizA)
+        permutacao = list(range(n))
+
+        # Referências às linhas de LU na ordem dos pivôs (funciona tanto para
+        # listas de listas quanto para MatrizCompacta, sem mover dados).
+        linhas = [LU[i] for i in range(n)]
+
+        for k in range(n):
+            # Pivoteamento parcial: troca de linhas por referência, sem cópias.
+            p = max(range(k, n), key=lambda i: abs(linhas[i][k]))
+            if linhas[p][k] == 0:
+                raise ValueError("A matriz é singular.")
+            if p != k:
+                linhas[k], linhas[p] = linhas[p], linhas[k]
+                permutacao[k], permutacao[p] = permutacao[p], permutacao[k]
+
+            linha_k = linhas[k]
+            pivo = linha_k[k]
+            # Só as colunas não nulas da linha pivô alteram as demais linhas.
+            colunas_k = [j for j in range(k + 1, n) if linha_k[j] != 0]
+            for i in range(k + 1, n):
+                linha_i = linhas[i]
+                l_ik = linha_i[k] / pivo
+                linha_i[k] = l_ik
+                if l_ik != 0:
+                    for j in colunas_k:
+                        linha_i[j] -= l_ik * linha_k[j]
+
+        self.LU = linhas
+        self.permutacao = permutacao
+        self.ordem = ordem
+        self.n = n
+
+    def resolver(self, vetorB: List[float]) -> List[float]:
+        """
+        Resolve Ax = b reutilizando a fatoração (substituições progressiva e
+        regressiva).
+        """
+        LU = self.LU
+        n = self.n
+
+        if self.ordem is not None:
+            vetorB = [vetorB[i] for i in self.ordem]
+
+        # Resolver Ly = Pb
+        y = [vetorB[p] for p in self.permutacao]
+        for i in range(n):
+            linha = LU[i]
+            soma = 0.0
+            for j in range(i):
+                soma += linha[j] * y[j]
+            y[i] -= soma
+
+        # Resolver Ux = y
+        x = y
+        for i in range(n - 1, -1, -1):
+            linha = LU[i]
+            soma = 0.0
+            for j in range(i + 1, n):
+                soma += linha[j] * x[j]
+            x[i] = (x[i] - soma) / linha[i]
+
+        if self.ordem is not None:
+            x_original = [0.0] * n
+            for i, j in enumerate(self.ordem):
+                x_original[j] = x[i]
+            x = x_original
+
+        return x
+
+    def resolver_lote(self, matrizB: List[List[float]]) -> List[List[float]]:
+        """
+        Resolve AX = B para uma matriz B (n x k) de lados direitos, processando
+        todas as colunas em cada passo das substituições.
+        """
+        LU = self.LU
+        n = self.n
+
+        if self.ordem is not None:
+            matrizB = [matrizB[i] for i in self.ordem]
+
+        # Resolver LY = PB
+        Y = [list(matrizB[p]) for p in self.permutacao]
+        for i in range(n):
+            linha = LU[i]
+            Y_i = Y[i]
+            for j in range(i):
+                l_ij = linha[j]
+                if l_ij != 0:
+                    Y_j = Y[j]
+                    Y_i[:] = [a - l_ij * b for a, b in zip(Y_i, Y_j)]
+
+        # Resolver UX = Y
+        X = Y
+        for i in range(n - 1, -1, -1):
+            linha = LU[i]
+            X_i = X[i]
+            for j in range(i + 1, n):
+                u_ij = linha[j]
+                if u_ij != 0:
+                    X_j = X[j]
+                    X_i[:] = [a - u_ij * b for a, b in zip(X_i, X_j)]
+            pivo = linha[i]
+            X_i[:] = [a / pivo for a in X_i]
+
+        if self.ordem is not None:
+            X_original = [None] * n
+            for i, j in enumerate(self.ordem):
+                X_original[j] = X[i]
+            X = X_original
+
+        return X
+
+
+class PrecondicionadorJacobi:
+    """
+    Precondicionador diagonal: M = diag(A), aplicado como z = D⁻¹r.
+    """
+
+    def __init__(self, matrizA):
+        if isinstance(matrizA, MatrizEsparsa):
+            diagonal = np.array(matrizA.diagonal())
+        else:
+            diagonal = Matriz._como_array(matrizA).diagonal()
+        if np.any(diagonal == 0):
+            raise ValueError("A diagonal da matriz possui elementos nulos.")
+        self.inv_diagonal = 1.0 / diagonal
+
+    def aplicar(self, r: np.ndarray) -> np.ndarray:
+        if r.ndim == 2:
+            return self.inv_diagonal[:, np.newaxis] * r
+        return self.inv_diagonal * r
+
+
+class PrecondicionadorILU0:
+    """
+    Fatoração LU incompleta sem preenchimento (ILU(0)): L e U mantêm a mesma
+    estrutura de não nulos de A, guardadas juntas em uma MatrizEsparsa
+    (L com diagonal unitária implícita).
+    """
+
+    def __init__(self, matrizA):
+        if not isinstance(matrizA, MatrizEsparsa):
+            matrizA = MatrizEsparsa.de_densa(Matriz._como_array(matrizA).tolist())
+
+        n = matrizA.linhas
+        ponteiros, indices = matrizA.ponteiros, matrizA.indices
+        valores = array("d", matrizA.valores)
+
+        # Posição de cada elemento (i, j) no vetor de valores.
+        posicao = [
+            {indices[k]: k for k in range(ponteiros[i], ponteiros[i + 1])}
+            for i in range(n)
+        ]
+        diagonal = [posicao[i].get(i) for i in range(n)]
+        if any(k is None for k in diagonal):
+            raise ValueError("A ILU(0) exige todos os elementos da diagonal.")
+
+        for i in range(1, n):
+            linha_i = posicao[i]
+            for k_pos in range(ponteiros[i], ponteiros[i + 1]):
+                k = indices[k_pos]
+                if k >= i:
+                    break
+                valores[k_pos] /= valores[diagonal[k]]
+                l_ik = valores[k_pos]
+                for kj in range(diagonal[k] + 1, ponteiros[k + 1]):
+                    ij = linha_i.get(indices[kj])
+                    if ij is not None:
+                        valores[ij] -= l_ik * valores[kj]
+
+        self.LU = MatrizEsparsa(
+            n,
+            n,
+            array(ponteiros.typecode, ponteiros),
+            array(indices.typecode, indices),
+            valores,
+        )
+
+    def aplicar(self, r: np.ndarray) -> np.ndarray:
+        if r.ndim == 2:
+            return np.column_stack([self.aplicar(coluna) for coluna in r.T])
+        y = self.LU.resolver_triangular_inferior(r.tolist(), diagonal_unitaria=True)
+        return np.array(self.LU.resolver_triangular_superior(y))
 
 
 class SolversLineares:
@@ -9,95 +247,207 @@ class SolversLineares:
         self.vetorB = None
         self.tol = None
         self.lim_iter = None
+        self.historico = []
+        # Ordenações de mínimo grau reaproveitadas entre chamadas de
+        # decomposicao_lu com a mesma topologia.
+        self.ordenacao = Ordenacao()
+
+    @staticmethod
+    def _eh_lote(vetorB) -> bool:
+        """
+        Indica se o lado direito é uma matriz B (n x k) de vários sistemas.
+        """
+        if isinstance(vetorB, MatrizCompacta):
+            return True
+        if isinstance(vetorB, np.ndarray):
+            return vetorB.ndim == 2
+        return len(vetorB) > 0 and isinstance(
+            vetorB[0], (list, tuple, memoryview, np.ndarray)
+        )
+
+    @staticmethod
+    def _verificar_solucao(matrizA, x, vetorB, tol: float) -> None:
+        """
+        Verifica se a solução obtida satisfaz a equação A * x = b (ou A * X = B).
+        """
+        produto = Matriz.multiplicar(matrizA, x)
+        if SolversLineares._eh_lote(vetorB):
+            erro_max = max(
+                Vetor.norma_infinita(Vetor.subtracao(linha_AX, linha_B))
+                for linha_AX, linha_B in zip(produto, vetorB)
+            )
+        else:
+            erro = Vetor.subtracao(produto, vetorB)
+            erro_max = Vetor.norma_infinita(erro)
+
+        if erro_max <= tol:
+            print(f"\n\tA solução converge com erro máximo: {erro_max:.2e}")
+        else:
+            print(f"\n\tA solução não converge. Erro máximo: {erro_max:.2e}")
 
     def gauss(
         self,
         matrizA: List[List[float]],
         vetorB: List[float],
         tol: float = 1e-5,
+        sobrescrever: bool = False,
+        nucleo: str = "python",
     ) -> List[float]:
         """
         Resolve um sistema de equações lineares da forma Ax = B
-        utilizando o método de eliminação de Gauss.
+        utilizando o método de eliminação de Gauss com pivoteamento parcial.
+
+        Com `sobrescrever=True`, A e b são usados como área de trabalho (sem
+        cópias) e a verificação do resíduo é omitida, já que A deixa de estar
+        disponível. Com `nucleo="numpy"`, as atualizações de linha são feitas
+        como operações vetoriais sobre arrays NumPy.
+
+        `vetorB` também pode ser uma matriz B (n x k): a eliminação é feita uma
+        única vez, aplicada a todas as colunas, e o retorno é X (n x k).
         """
-        A = Matriz.clone(matrizA)  # Copia a matriz para não modificar a original
-        b = vetorB.copy()  # Copia o vetor para não modificar o original
+        if nucleo == "numpy":
+            x = self._gauss_numpy(matrizA, vetorB, sobrescrever)
+        elif nucleo == "python":
+            x = self._gauss_python(matrizA, vetorB, sobrescrever)
+        else:
+            raise ValueError(f"Núcleo desconhecido: {nucleo}")
+
+        if sobrescrever:
+            return x
+
+        # Fase 3: Verifica se a solução obtida satisfaz a equação A * x = b.
+        self._verificar_solucao(matrizA, x, vetorB, tol)
+        return x
+
+    @staticmethod
+    def _gauss_python(
+        matrizA: List[List[float]], vetorB: List[float], sobrescrever: bool
+    ) -> List[float]:
+        lote = SolversLineares._eh_lote(vetorB)
+        if sobrescrever:
+            A, b = matrizA, vetorB
+        else:
+            A = Matriz.clone(matrizA)  # Copia a matriz para não modificar a original
+            # Copia o vetor (ou as linhas de B) para não modificar o original
+            b = [list(linha) for linha in vetorB] if lote else list(vetorB)
         n = len(A)
         x = Vetor.criar(n)  # Inicializa o vetor solução com zeros
 
+        # As trocas de linha são feitas sobre o vetor de índices `p`.
+        p = list(range(n))
+
         # Fase 1: Eliminação de Gauss (transforma a A em uma matriz triangular superior).
-        for k in range(n - 1):
+        # O pivô da última coluna também é verificado.
+        for k in range(n):
+            m = max(range(k, n), key=lambda i: abs(A[p[i]][k]))
+            if A[p[m]][k] == 0:
+                raise ValueError("A matriz é singular.")
+            p[k], p[m] = p[m], p[k]
+
+            linha_k = A[p[k]]
+            pivo = linha_k[k]
             for i in range(k + 1, n):
-                l_ik = A[i][k] / A[k][k]
-                for j in range(k, n):
-                    A[i][j] -= l_ik * A[k][j]
-                b[i] -= l_ik * b[k]
+                linha_i = A[p[i]]
+                l_ik = linha_i[k] / pivo
+                if l_ik == 0:
+                    continue
+                # Apenas a parte ainda não eliminada da linha é percorrida.
+                linha_i[k] = 0.0
+                for j in range(k + 1, n):
+                    linha_i[j] -= l_ik * linha_k[j]
+                if lote:
+                    b[p[i]][:] = [bi - l_ik * bk for bi, bk in zip(b[p[i]], b[p[k]])]
+                else:
+                    b[p[i]] -= l_ik * b[p[k]]
 
         # Fase 2: Substituição regressiva (resolve o sistema triangular superior Ux = c).
         for k in range(n - 1, -1, -1):
-            x[k] = b[k]
+            linha_k = A[p[k]]
+            if lote:
+                x_k = list(b[p[k]])
+                for i in range(k + 1, n):
+                    a_ki = linha_k[i]
+                    if a_ki != 0:
+                        x_k = [xk - a_ki * xi for xk, xi in zip(x_k, x[i])]
+                x[k] = [xk / linha_k[k] for xk in x_k]
+                continue
+            x[k] = b[p[k]]
             for i in range(k + 1, n):
-                x[k] -= A[k][i] * x[i]
-            x[k] /= A[k][k]
+                x[k] -= linha_k[i] * x[i]
+            x[k] /= linha_k[k]
 
-        # Fase 3: Verifica se a solução obtida satisfaz a equação A * x = b.
-        produto = Matriz.multiplicar(matrizA, x)
-        erro = Vetor.subtracao(produto, vetorB)
-        erro_max = Vetor.norma_infinita(erro)
+        return x
 
-        if erro_max <= tol:
-            print(f"\n\tA solução converge com erro máximo: {erro_max:.2e}")
+    @staticmethod
+    def _gauss_numpy(matrizA, vetorB, sobrescrever: bool) -> List[float]:
+        # Entradas contíguas (np.ndarray float64 ou MatrizCompacta) são
+        # modificadas diretamente, sem cópia.
+        if isinstance(matrizA, MatrizCompacta):
+            matrizA = matrizA.como_numpy()
+        if isinstance(vetorB, MatrizCompacta):
+            vetorB = vetorB.como_numpy()
+        if sobrescrever:
+            A = np.asarray(matrizA, dtype=float)
+            b = np.asarray(vetorB, dtype=float)
         else:
-            print(f"\n\tA solução não converge. Erro máximo: {erro_max:.2e}")
-        return x
+            A = np.array(matrizA, dtype=float)
+            b = np.array(vetorB, dtype=float)
+        n = len(b)
+
+        # Fase 1: Eliminação, com a atualização de cada linha feita vetorialmente.
+        # O pivô da última coluna também é verificado.
+        for k in range(n):
+            m = k + int(np.argmax(np.abs(A[k:, k])))
+            if A[m, k] == 0:
+                raise ValueError("A matriz é singular.")
+            if m != k:
+                A[[k, m]] = A[[m, k]]
+                b[[k, m]] = b[[m, k]]
+
+            l = A[k + 1 :, k] / A[k, k]
+            A[k + 1 :, k:] -= np.outer(l, A[k, k:])
+            b[k + 1 :] -= np.multiply.outer(l, b[k])
+
+        # Fase 2: Substituição regressiva (b e x podem ter k colunas).
+        x = np.zeros(b.shape)
+        for k in range(n - 1, -1, -1):
+            x[k] = (b[k] - A[k, k + 1 :] @ x[k + 1 :]) / A[k, k]
+
+        return x.tolist()
 
     def decomposicao_lu(
         self,
         matrizA: List[List[float]],
         vetorB: List[float],
         tol: float = 1e-5,
+        ordenar: bool = False,
+        ordenacao: Ordenacao = None,
     ) -> List[float]:
         """
         Decomposição LU: Resolve o sistema Ax = B utilizando a decomposição LU,
-        onde A = LU e L é uma matriz triangular inferior com 1s na diagonal principal
-        e U é uma matriz triangular superior.
-        """
-        n = len(matrizA)
-        matrizL = Matriz.diagonal_principal(n, 1.0)  # Inicializa L com 1s na diagonal
-        matrizU = Matriz.clone(matrizA)  # Copia A para U
-
-        b = vetorB.copy()
+        onde PA = LU e L é uma matriz triangular inferior com 1s na diagonal principal
+        e U é uma matriz triangular superior. Para vários lados direitos com a mesma
+        matriz A, use FatoracaoLU diretamente. Com `ordenar=True`, aplica a
+        ordenação de mínimo grau antes da fatoração, reaproveitando as ordenações
+        já calculadas por esta instância; uma `ordenacao` informada é usada no
+        lugar do cache da instância (e também ativa a reordenação).
 
-        # Fase 1: Decomposição LU
-        for k in range(n):
-            for i in range(k + 1, n):
-                l_ik = matrizU[i][k] / matrizU[k][k]
-                matrizL[i][k] = l_ik
-                for j in range(k, n):
-                    matrizU[i][j] -= l_ik * matrizU[k][j]
-
-        # Fase 2: Substituição.
-        # Resolver Ly = B
-        y = Vetor.criar(n)  # Inicializa y com zeros
-        for i in range(n):
-            soma = Vetor.produto_escalar(matrizL[i], y[:i])
-            y[i] = b[i] - soma
+        `vetorB` também pode ser uma matriz B (n x k): A é fatorada uma única
+        vez e o retorno é X (n x k).
+        """
+        # Fase 1: Decomposição LU (com pivoteamento parcial)
+        if ordenar and ordenacao is None:
+            ordenacao = self.ordenacao
+        fatoracao = FatoracaoLU(matrizA, ordenacao=ordenacao)
 
-        # Resolver Ux = y
-        x = Vetor.criar(n)  # Inicializa x com zeros
-        for i in range(n - 1, -1, -1):
-            soma = Vetor.produto_escalar(matrizU[i][i + 1 :], x[i + 1 :])
-            x[i] = (y[i] - soma) / matrizU[i][i]
+        # Fase 2: Substituição (Ly = Pb e Ux = y)
+        if self._eh_lote(vetorB):
+            x = fatoracao.resolver_lote(vetorB)
+        else:
+            x = fatoracao.resolver(vetorB)
 
         # Fase 3: Verifica se a solução obtida satisfaz a equação A * x = b.
-        produto = Matriz.multiplicar(matrizA, x)
-        erro = Vetor.subtracao(produto, vetorB)
-        erro_max = Vetor.norma_infinita(erro)
-
-        if erro_max < tol:
-            print(f"\n\tA solução converge com erro máximo: {erro_max:.2e}")
-        else:
-            print(f"\n\tA solução não converge. Erro máximo: {erro_max:.2e}")
+        self._verificar_solucao(matrizA, x, vetorB, tol)
         return x
 
     def jacobi(
@@ -106,28 +456,59 @@ class SolversLineares:
         vetorB: List[float],
         tol: float = 1e-5,
         lim_iter: int = 50,
+        nucleo: str = "python",
+        x0: List[float] = None,
     ) -> List[float]:
         """
         Resolve um sistema de equações lineares da forma Ax = B
-        utilizando o método iterativo de Jacobi.
+        utilizando o método iterativo de Jacobi. A matriz pode ser densa ou uma
+        MatrizEsparsa; neste caso cada varredura custa O(nnz).
+
+        Com `nucleo="numpy"`, cada varredura é um único produto matriz-vetor
+        vetorizado, x ← x + D⁻¹(b - Ax), com o inverso da diagonal calculado
+        uma vez. A norma do resíduo de cada varredura fica em `self.historico`.
+
+        `vetorB` também pode ser uma matriz B (n x k); nesse caso todas as
+        colunas são varridas juntas, como operações em bloco do núcleo NumPy.
+
+        `x0` é a estimativa inicial (partida a quente); por padrão, zeros.
         """
-        A = Matriz.clone(matrizA)
+        if nucleo == "numpy" or self._eh_lote(vetorB):
+            return self._jacobi_numpy(matrizA, vetorB, tol, lim_iter, x0)
+        elif nucleo != "python":
+            raise ValueError(f"Núcleo desconhecido: {nucleo}")
+
+        esparsa = isinstance(matrizA, MatrizEsparsa)
+        A = matrizA if esparsa else Matriz.clone(matrizA)
         b = vetorB.copy()
 
         n = len(b)
-        x = Vetor.criar(n)
+        x = Vetor.criar(n) if x0 is None else list(x0)
         x_novo = x.copy()
 
+        if esparsa:
+            diagonal = A.diagonal()
+
         iteracoes = 0
         convergencia = False
 
         while not convergencia and iteracoes < lim_iter:
-            for i in range(n):
-                soma = Vetor.produto_escalar(A[i], x) - A[i][i] * x[i]
-                x_novo[i] = (b[i] - soma) / A[i][i]
+            variacao = 0.0
+            if esparsa:
+                Ax = A.multiplicar(x)
+                for i in range(n):
+                    soma = Ax[i] - diagonal[i] * x[i]
+                    x_novo[i] = (b[i] - soma) / diagonal[i]
+                    variacao = max(variacao, abs(x_novo[i] - x[i]))
+            else:
+                for i in range(n):
+                    soma = Vetor.produto_escalar(A[i], x) - A[i][i] * x[i]
+                    x_novo[i] = (b[i] - soma) / A[i][i]
+                    variacao = max(variacao, abs(x_novo[i] - x[i]))
 
-            convergencia = all(abs(x_novo[i] - x[i]) < tol for i in range(n))
-            x = x_novo[:]
+            convergencia = variacao < tol
+            # Troca dos vetores em vez de cópia.
+            x, x_novo = x_novo, x
             iteracoes += 1
 
         if convergencia:
@@ -136,43 +517,444 @@ class SolversLineares:
             print(f"\n\tO método não convergiu após {iteracoes} iterações.")
         return x
 
+    def _jacobi_numpy(
+        self, matrizA, vetorB, tol: float, lim_iter: int, x0=None
+    ) -> List[float]:
+        if isinstance(matrizA, MatrizEsparsa):
+            diagonal = np.array(matrizA.diagonal())
+
+            def produto(v, saida):
+                saida[:] = matrizA.multiplicar_vetorizado(v)
+
+        else:
+            A = Matriz._como_array(matrizA)
+            diagonal = A.diagonal().copy()
+
+            def produto(v, saida):
+                np.matmul(A, v, out=saida)
+
+        b = Matriz._como_array(vetorB)
+        inv_diagonal = 1.0 / diagonal
+        if b.ndim == 2:
+            inv_diagonal = inv_diagonal[:, np.newaxis]
+
+        # Vetores de trabalho alocados uma única vez.
+        x = np.zeros(b.shape) if x0 is None else Matriz._como_array(x0).copy()
+        Ax = np.empty(b.shape)
+        residuo = np.empty(b.shape)
+        passo = np.empty(b.shape)
+
+        self.historico = []
+        iteracoes = 0
+        convergencia = False
+
+        while not convergencia and iteracoes < lim_iter:
+            produto(x, Ax)
+            np.subtract(b, Ax, out=residuo)
+            self.historico.append(float(np.linalg.norm(residuo)))
+
+            np.multiply(inv_diagonal, residuo, out=passo)
+            x += passo
+
+            convergencia = np.max(np.abs(passo)) < tol
+            iteracoes += 1
+
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+        return x.tolist()
+
     def gauss_seidel(
         self,
         matrizA: List[List[float]],
         vetorB: List[float],
         tol: float = 1e-5,
         lim_iter: int = 50,
+        omega: Union[float, str] = 1.0,
+        simetrico: bool = False,
+        x0: List[float] = None,
     ) -> List[float]:
         """
         Resolve um sistema de equações lineares da forma Ax = B
-        utilizando o método iterativo de Gauss-Seidel.
+        utilizando o método iterativo de Gauss-Seidel. A matriz pode ser densa ou
+        uma MatrizEsparsa; neste caso cada varredura custa O(nnz).
+
+        `omega` é o fator de relaxação (SOR): 1.0 corresponde ao Gauss-Seidel
+        clássico e "auto" usa o valor ótimo estimado por `omega_otimo`. Com
+        `simetrico=True`, cada iteração faz uma varredura progressiva e outra
+        regressiva (SSOR).
+
+        `vetorB` também pode ser uma matriz B (n x k); nesse caso cada linha é
+        atualizada de uma vez para todas as colunas (operações em bloco).
+
+        `x0` é a estimativa inicial (partida a quente); por padrão, zeros.
         """
-        A = Matriz.clone(matrizA)
-        b = vetorB.copy()
+        if omega == "auto":
+            omega = self.omega_otimo(matrizA)
+
+        if self._eh_lote(vetorB):
+            return self._gauss_seidel_lote(
+                matrizA, vetorB, tol, lim_iter, omega, simetrico, x0
+            )
+
+        esparsa = isinstance(matrizA, MatrizEsparsa)
+        A = matrizA
+        b = vetorB
         n = len(b)
-        x = Vetor.criar(n)  # Vetor inicial (começando em zero)
+        # Vetor inicial (começando em zero, salvo partida a quente)
+        x = Vetor.criar(n) if x0 is None else list(x0)
+
+        if esparsa:
+            diagonal = A.diagonal()
+            ponteiros, indices, valores = A.ponteiros, A.indices, A.valores
+        else:
+            diagonal = [A[i][i] for i in range(n)]
+
+        def varrer(ordem) -> float:
+            # Atualiza x no próprio vetor, sem fatias nem listas temporárias, e
+            # devolve a maior variação da varredura.
+            variacao = 0.0
+            for i in ordem:
+                if esparsa:
+                    soma = 0.0
+                    for k in range(ponteiros[i], ponteiros[i + 1]):
+                        soma += valores[k] * x[indices[k]]
+                else:
+                    soma = sum(map(operator.mul, A[i], x))
+                # A soma inclui o termo da diagonal, que é descontado aqui.
+                soma -= diagonal[i] * x[i]
+
+                x_gs = (b[i] - soma) / diagonal[i]
+                x_novo = x[i] + omega * (x_gs - x[i])
+
+                variacao = max(variacao, abs(x_novo - x[i]))
+                x[i] = x_novo
+            return variacao
+
+        progressiva = range(n)
+        regressiva = range(n - 1, -1, -1)
 
         iteracoes = 0
         convergencia = False
 
         while not convergencia and iteracoes < lim_iter:
-            convergencia = True  # Assume que convergiu nesta iteração
+            variacao = varrer(progressiva)
+            if simetrico:
+                variacao = max(variacao, varrer(regressiva))
 
-            for i in range(n):
-                soma = Vetor.produto_escalar(A[i][:i], x[:i]) + Vetor.produto_escalar(
-                    A[i][i + 1 :], x[i + 1 :]
-                )
-                x_novo = (b[i] - soma) / A[i][i]
+            # Não convergiu se a diferença for maior que a tolerância
+            convergencia = variacao < tol
+            iteracoes += 1
 
-                if abs(x_novo - x[i]) >= tol:
-                    convergencia = (
-                        False  # Não convergiu se a diferença for maior que a tolerância
-                    )
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+        return x
 
-                x[i] = x_novo
+    def _gauss_seidel_lote(
+        self,
+        matrizA,
+        vetorB,
+        tol: float,
+        lim_iter: int,
+        omega: float,
+        simetrico: bool,
+        x0=None,
+    ) -> List[List[float]]:
+        B = Matriz._como_array(vetorB)
+        n = B.shape[0]
+        X = np.zeros(B.shape) if x0 is None else Matriz._como_array(x0).copy()
+
+        if isinstance(matrizA, MatrizEsparsa):
+            diagonal = matrizA.diagonal()
+            ponteiros = np.frombuffer(
+                matrizA.ponteiros, dtype=np.dtype(matrizA.ponteiros.typecode)
+            )
+            indices = np.frombuffer(
+                matrizA.indices, dtype=np.dtype(matrizA.indices.typecode)
+            )
+            valores = np.frombuffer(matrizA.valores, dtype=float)
 
+            def soma_linha(i):
+                inicio, fim = ponteiros[i], ponteiros[i + 1]
+                return valores[inicio:fim] @ X[indices[inicio:fim]]
+
+        else:
+            A = Matriz._como_array(matrizA)
+            diagonal = A.diagonal()
+
+            def soma_linha(i):
+                return A[i] @ X
+
+        def varrer(ordem) -> float:
+            variacao = 0.0
+            for i in ordem:
+                # A soma inclui o termo da diagonal, que é descontado aqui.
+                soma = soma_linha(i) - diagonal[i] * X[i]
+                passo = omega * ((B[i] - soma) / diagonal[i] - X[i])
+                X[i] += passo
+                variacao = max(variacao, float(np.max(np.abs(passo))))
+            return variacao
+
+        iteracoes = 0
+        convergencia = False
+
+        while not convergencia and iteracoes < lim_iter:
+            variacao = varrer(range(n))
+            if simetrico:
+                variacao = max(variacao, varrer(range(n - 1, -1, -1)))
+            convergencia = variacao < tol
             iteracoes += 1
 
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+        return X.tolist()
+
+    def omega_otimo(self, matrizA: List[List[float]], iteracoes: int = 30) -> float:
+        """
+        Estima o fator de relaxação ótimo do SOR, ω = 2 / (1 + sqrt(1 - ρ²)),
+        onde ρ é o raio espectral da matriz de iteração de Jacobi I - D⁻¹A,
+        obtido pelo método das potências. Retorna 1.0 se ρ >= 1.
+        """
+        if isinstance(matrizA, MatrizEsparsa):
+            diagonal = matrizA.diagonal()
+            produto = matrizA.multiplicar
+        else:
+            diagonal = [matrizA[i][i] for i in range(len(matrizA))]
+
+            def produto(v):
+                return Matriz.multiplicar(matrizA, v)
+
+        n = len(diagonal)
+        # Vetor inicial não alinhado com nenhum autovetor em particular.
+        v = [1.0 + i / n for i in range(n)]
+        rho = 0.0
+        for _ in range(iteracoes):
+            norma_v = Vetor.norma(v)
+            if norma_v == 0:
+                return 1.0
+            Av = produto(v)
+            v = [vi - avi / di for vi, avi, di in zip(v, Av, diagonal)]
+            rho = Vetor.norma(v) / norma_v
+
+        if rho >= 1:
+            return 1.0
+        return 2.0 / (1.0 + math.sqrt(1.0 - rho**2))
+
+    @staticmethod
+    def _operador(matrizA):
+        """
+        Retorna a função que calcula A·v para vetores NumPy.
+        """
+        if isinstance(matrizA, MatrizEsparsa):
+            return matrizA.multiplicar_vetorizado
+        A = Matriz._como_array(matrizA)
+        return lambda v: A @ v
+
+    @staticmethod
+    def _precondicionador(matrizA, precondicionador):
+        """
+        Obtém a função z = M⁻¹r a partir de None, "jacobi", "ilu0", de um
+        objeto com o método `aplicar` ou de uma função.
+        """
+        if precondicionador is None:
+            return lambda r: r
+        if precondicionador == "jacobi":
+            return PrecondicionadorJacobi(matrizA).aplicar
+        if precondicionador == "ilu0":
+            return PrecondicionadorILU0(matrizA).aplicar
+        if hasattr(precondicionador, "aplicar"):
+            return precondicionador.aplicar
+        if callable(precondicionador):
+            return precondicionador
+        raise ValueError(f"Precondicionador desconhecido: {precondicionador}")
+
+    def gradiente_conjugado(
+        self,
+        matrizA: List[List[float]],
+        vetorB: List[float],
+        tol: float = 1e-5,
+        lim_iter: int = 1000,
+        precondicionador=None,
+        x0: List[float] = None,
+    ) -> List[float]:
+        """
+        Resolve Ax = B, com A simétrica definida positiva, pelo método dos
+        gradientes conjugados precondicionado. Cada iteração custa um produto
+        matriz-vetor (O(nnz) para MatrizEsparsa) e uma aplicação de M⁻¹. O
+        critério de parada é ||b - Ax|| <= tol·max(||b||, 1): relativo para
+        ||b|| >= 1 e absoluto para lados direitos pequenos (ou nulos). A norma
+        do resíduo de cada iteração fica em `self.historico`.
+
+        `vetorB` também pode ser uma matriz B (n x k): as k recorrências são
+        avançadas juntas, com produtos em bloco, e colunas já convergidas ficam
+        congeladas. O histórico guarda então o maior resíduo entre as colunas.
+
+        `x0` é a estimativa inicial (partida a quente); por padrão, zeros.
+        """
+        produto = self._operador(matrizA)
+        aplicar_M = self._precondicionador(matrizA, precondicionador)
+
+        b = Matriz._como_array(vetorB)
+        if x0 is None:
+            x = np.zeros(b.shape)
+            r = b.copy()
+        else:
+            x = Matriz._como_array(x0).copy()
+            r = b - produto(x)
+        z = aplicar_M(r)
+        p = z.copy()
+        rz = np.sum(r * z, axis=0)
+        limite = tol * np.maximum(np.linalg.norm(b, axis=0), 1.0)
+
+        normas = np.linalg.norm(r, axis=0)
+        self.historico = [float(np.max(normas))]
+        iteracoes = 0
+        convergencia = bool(np.all(normas <= limite))
+
+        while not convergencia and iteracoes < lim_iter:
+            ativas = normas > limite
+            Ap = produto(p)
+            pAp = np.sum(p * Ap, axis=0)
+            alfa = np.where(ativas, rz / np.where(ativas, pAp, 1.0), 0.0)
+            x += alfa * p
+            r -= alfa * Ap
+            iteracoes += 1
+
+            normas = np.linalg.norm(r, axis=0)
+            self.historico.append(float(np.max(normas)))
+            if np.all(normas <= limite):
+                convergencia = True
+                break
+
+            z = aplicar_M(r)
+            rz_novo = np.sum(r * z, axis=0)
+            beta = np.where(ativas, rz_novo / np.where(ativas, rz, 1.0), 0.0)
+            p = z + beta * p
+            rz = rz_novo
+
+        if convergencia:
+            print(f"\n\tO método convergiu após {iteracoes} iterações.")
+        else:
+            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+        return x.tolist()
+
+    def gmres(
+        self,
+        matrizA: List[List[float]],
+        vetorB: List[float],
+        tol: float = 1e-5,
+        lim_iter: int = 1000,
+        precondicionador=None,
+        reinicio: int = 30,
+        x0: List[float] = None,
+    ) -> List[float]:
+        """
+        Resolve Ax = B, com A qualquer (por exemplo, a Jacobiana do
+        Newton-Raphson), pelo GMRES com reinício a cada `reinicio` iterações e
+        precondicionamento à direita (A M⁻¹ u = b, x = M⁻¹u), de modo que o
+        resíduo acompanhado é o do sistema original. O critério de parada é
+        ||b - Ax|| <= tol·max(||b||, 1), relativo para ||b|| >= 1 e absoluto
+        para lados direitos pequenos; o histórico do resíduo fica em
+        `self.historico`.
+
+        `vetorB` também pode ser uma matriz B (n x k). Como cada coluna gera
+        seu próprio subespaço de Krylov, as colunas são resolvidas em sequência,
+        mas o operador e o precondicionador (por exemplo, a ILU(0)) são
+        montados uma única vez; o histórico fica em `self.historico` por coluna.
+
+        `x0` é a estimativa inicial (partida a quente); por padrão, zeros.
+        """
+        produto = self._operador(matrizA)
+        aplicar_M = self._precondicionador(matrizA, precondicionador)
+
+        b = Matriz._como_array(vetorB)
+        x = np.zeros(b.shape) if x0 is None else Matriz._como_array(x0).copy()
+
+        if b.ndim == 2:
+            colunas, historicos = [], []
+            for b_j, x_j in zip(b.T, x.T):
+                colunas.append(
+                    self._gmres_vetor(
+                        produto, aplicar_M, b_j, x_j, tol, lim_iter, reinicio
+                    )
+                )
+                historicos.append(self.historico)
+            self.historico = historicos
+            return np.column_stack(colunas).tolist()
+
+        return self._gmres_vetor(
+            produto, aplicar_M, b, x, tol, lim_iter, reinicio
+        ).tolist()
+
+    def _gmres_vetor(self, produto, aplicar_M, b, x, tol, lim_iter, reinicio):
+        n = len(b)
+        x = x.copy()
+        limite = tol * max(np.linalg.norm(b), 1.0)
+
+        r = b - produto(x)
+        beta = np.linalg.norm(r)
+        self.historico = [float(beta)]
+        iteracoes = 0
+        convergencia = beta <= limite
+
+        while not convergencia and iteracoes < lim_iter:
+            m = min(reinicio, lim_iter - iteracoes, n)
+            Q = np.zeros((n, m + 1))  # Base de Arnoldi
+            Z = np.zeros((n, m))  # Direções precondicionadas M⁻¹q
+            H = np.zeros((m + 1, m))  # Hessenberg superior
+            cs = np.zeros(m)
+            sn = np.zeros(m)
+            g = np.zeros(m + 1)
+            g[0] = beta
+            Q[:, 0] = r / beta
+
+            k = 0
+            for k in range(m):
+                Z[:, k] = aplicar_M(Q[:, k])
+                w = produto(Z[:, k])
+
+                # Gram-Schmidt modificado
+                for i in range(k + 1):
+                    H[i, k] = w @ Q[:, i]
+                    w -= H[i, k] * Q[:, i]
+                H[k + 1, k] = np.linalg.norm(w)
+                if H[k + 1, k] != 0:
+                    Q[:, k + 1] = w / H[k + 1, k]
+
+                # Rotações de Givens acumuladas
+                for i in range(k):
+                    h_i = H[i, k]
+                    H[i, k] = cs[i] * h_i + sn[i] * H[i + 1, k]
+                    H[i + 1, k] = -sn[i] * h_i + cs[i] * H[i + 1, k]
+                raio = np.hypot(H[k, k], H[k + 1, k])
+                cs[k] = H[k, k] / raio
+                sn[k] = H[k + 1, k] / raio
+                H[k, k] = raio
+                H[k + 1, k] = 0.0
+                g[k + 1] = -sn[k] * g[k]
+                g[k] = cs[k] * g[k]
+
+                iteracoes += 1
+                self.historico.append(float(abs(g[k + 1])))
+                if abs(g[k + 1]) <= limite:
+                    convergencia = True
+                    break
+
+            # Atualiza x com a solução do sistema triangular de Hessenberg.
+            y = np.zeros(k + 1)
+            for i in range(k, -1, -1):
+                y[i] = (g[i] - H[i, i + 1 : k + 1] @ y[i + 1 :]) / H[i, i]
+            x += Z[:, : k + 1] @ y
+
+            r = b - produto(x)
+            beta = np.linalg.norm(r)
+            convergencia = beta <= limite
+
         if convergencia:
             print(f"\n\tO método convergiu após {iteracoes} iterações.")
         else:
@@ -180,6 +962,42 @@ class SolversLineares:
         return x
 
 
+class FuncaoMemorizada:
+    """
+    Envolve uma função escalar f, guardando os valores já calculados (cada
+    ponto x é avaliado no máximo uma vez) e contando as avaliações reais.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.cache = {}
+        self.avaliacoes = 0
+
+    def __call__(self, x):
+        try:
+            return self.cache[x]
+        except KeyError:
+            pass
+        except TypeError:
+            # Argumentos não hasheáveis (por exemplo, arrays) não são guardados.
+            self.avaliacoes += 1
+            return self.f(x)
+
+        valor = self.f(x)
+        self.avaliacoes += 1
+        self.cache[x] = valor
+        return valor
+
+
+def _refinar_intervalo(argumentos):
+    """
+    Refina a raiz de um intervalo com mudança de sinal pelo método de Brent.
+    Definida no nível do módulo para poder ser executada em outro processo.
+    """
+    f, a, b, f_a, f_b, tol, lim_iter = argumentos
+    return SolversNaoLineares._brent(f, a, b, f_a, f_b, tol, lim_iter)
+
+
 class SolversNaoLineares:
     def __init__(self):
         self.f = None
@@ -188,17 +1006,48 @@ class SolversNaoLineares:
         self.x1 = None
         self.tol = None
         self.lim_iter = None
+        self.iteracoes = 0
+        self.avaliacoes = 0
 
+    def _memorizar(self, f):
+        """
+        Envolve f em uma FuncaoMemorizada nova, usada durante um método.
+        """
+        if isinstance(f, FuncaoMemorizada):
+            f = f.f
+        self.f = FuncaoMemorizada(f)
+        return self.f
+
+    def _relatar(self, convergencia, iteracoes):
+        """
+        Registra e exibe o número de iterações e de avaliações de f.
+        """
+        self.iteracoes = iteracoes
+        self.avaliacoes = self.f.avaliacoes
+        if convergencia:
+            print(
+                f"\n\tO método convergiu após {iteracoes} iterações "
+                f"e {self.avaliacoes} avaliações de f."
+            )
+        else:
+            print(
+                f"\n\tO método não convergiu após {iteracoes} iterações "
+                f"e {self.avaliacoes} avaliações de f."
+            )
 
     def bissecao(self, f, x0, x1, tol, lim_iter):
         """
         Encontra raízes de uma função f dentro de um intervalo [x1, x2]
         utilizando o método da bisseção.
         """
+        f = self._memorizar(f)
+        f_x0 = f(x0)
+        f_x1 = f(x1)
 
         # Verifica se a função f(x) muda de sinal no intervalo, caso contrário, o método da bisseção não pode ser aplicado.
-        if f(x0) * f(x1) > 0:
+        if f_x0 * f_x1 > 0:
             print("Nenhuma raiz encontrada no intervalo fornecido.")
+            self._relatar(False, 0)
             return None
 
         # Itera enquanto o erro for maior que a tolerância ou o número máximo de iterações não for atingido
@@ -206,42 +1055,45 @@ class SolversNaoLineares:
         convergencia = False
         while iteracoes < lim_iter:
             x = (x0 + x1) / 2.0
+            f_x = f(x)
+            iteracoes += 1
 
-            if f(x) == 0:
-                continue
+            # Raiz exata encontrada no ponto médio
+            if f_x == 0:
+                convergencia = True
+                break
 
             # Atualiza os valores
-            elif f(x0) * f(x) < 0:
-                x1 = x
+            elif f_x0 * f_x < 0:
+                x1, f_x1 = x, f_x
             else:
-                x0 = x
-
-            iteracoes += 1
+                x0, f_x0 = x, f_x
 
             # Verifica a condição de convergência
-            if abs(f(x1) - f(x0)) < tol:
+            if abs(f_x1 - f_x0) < tol:
                 convergencia = True
                 break
-        
-        if convergencia:
-            print(f"\n\tO método convergiu após {iteracoes} iterações.")
-        else:
-            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
 
-        return x
+        self._relatar(convergencia, iteracoes)
 
+        return x
 
     def secante(self, f, x0, x1, tol, lim_iter):
         """
         Encontra raízes de uma função f dentro de um intervalo [x1, x2]
         utilizando o método da secante.
         """
+        f = self._memorizar(f)
 
         # Calcula o valor inicial de f(x) para os pontos iniciais
-        if f(x0) == 0:
+        f_x0 = f(x0)
+        if f_x0 == 0:
+            self._relatar(True, 0)
             return f"Raiz: {x0}, Iterações: 0"
 
-        if f(x1) == 0:
+        f_x1 = f(x1)
+        if f_x1 == 0:
+            self._relatar(True, 1)
             return f"Raiz: {x1}, Iterações: 1"
 
         iteracoes = 0
@@ -250,61 +1102,315 @@ class SolversNaoLineares:
 
             # Calcula a nova aproximação utilizando a fórmula do método da secante
             try:
-                x2 = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
+                x2 = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
             except ZeroDivisionError:
+                self._relatar(False, iteracoes)
                 return "Divisão por zero!"
 
             # Atualiza os valores
-            x0, x1 = x1, x2
+            x0, f_x0 = x1, f_x1
+            x1, f_x1 = x2, f(x2)
             iteracoes += 1
 
             # Verifica a condição de convergência
-            if abs(f(x1)) < tol:
+            if abs(f_x1) < tol:
                 convergencia = True
                 break
-        
-        if convergencia:
-            print(f"\n\tO método convergiu após {iteracoes} iterações.")
-        else:
-            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+
+        self._relatar(convergencia, iteracoes)
 
         return x1
-    
-    def newton_raphson(self, f, x0, x1, tol, lim_iter):
+
+    def brent(self, f, x0, x1, tol, lim_iter):
+        """
+        Encontra raízes de uma função f dentro de um intervalo [x1, x2]
+        utilizando o método de Brent: interpolação quadrática inversa ou
+        secante quando o passo é aceitável, e bisseção caso contrário, de
+        modo que a raiz permanece sempre isolada no intervalo.
+        """
+        f = self._memorizar(f)
+        a, b = x0, x1
+        f_a, f_b = f(a), f(b)
+
+        # Verifica se a função f(x) muda de sinal no intervalo
+        if f_a * f_b > 0:
+            print("Nenhuma raiz encontrada no intervalo fornecido.")
+            self._relatar(False, 0)
+            return None
+
+        # Raiz em um dos extremos do intervalo
+        if f_a == 0 or f_b == 0:
+            self._relatar(True, 0)
+            return a if f_a == 0 else b
+
+        b, convergencia, iteracoes = self._brent(f, a, b, f_a, f_b, tol, lim_iter)
+
+        self._relatar(convergencia, iteracoes)
+
+        return b
+
+    @staticmethod
+    def _brent(f, a, b, f_a, f_b, tol, lim_iter):
+        """
+        Núcleo do método de Brent sobre um intervalo [a, b] com mudança de
+        sinal. Retorna a raiz, se houve convergência e o número de iterações.
+        """
+        # b é sempre a melhor estimativa e c o extremo oposto do intervalo
+        c, f_c = a, f_a
+        d = e = b - a
+
+        iteracoes = 0
+        convergencia = False
+        while iteracoes < lim_iter:
+            if f_b * f_c > 0:
+                c, f_c = a, f_a
+                d = e = b - a
+            if abs(f_c) < abs(f_b):
+                a, b, c = b, c, b
+                f_a, f_b, f_c = f_b, f_c, f_b
+
+            tol_passo = 2.0 * sys.float_info.epsilon * abs(b) + 0.5 * tol
+            m = 0.5 * (c - b)
+
+            # Verifica a condição de convergência
+            if abs(m) <= tol_passo or f_b == 0:
+                convergencia = True
+                break
+
+            if abs(e) >= tol_passo and abs(f_a) > abs(f_b):
+                s = f_b / f_a
+                if a == c:
+                    # Secante
+                    p = 2.0 * m * s
+                    q = 1.0 - s
+                else:
+                    # Interpolação quadrática inversa
+                    q = f_a / f_c
+                    r = f_b / f_c
+                    p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                    q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+
+                # Aceita a interpolação apenas se ela cair dentro do intervalo
+                # e reduzir o passo o suficiente; senão, usa a bisseção.
+                if 2.0 * p < min(3.0 * m * q - abs(tol_passo * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            # Atualiza os valores
+            a, f_a = b, f_b
+            b += d if abs(d) > tol_passo else math.copysign(tol_passo, m)
+            f_b = f(b)
+            iteracoes += 1
+
+        return b, convergencia, iteracoes
+
+    @staticmethod
+    def _avaliar_malha(f, malha):
+        """
+        Avalia f em todos os pontos da malha de uma só vez quando f aceita
+        arrays; caso contrário, avalia ponto a ponto.
+        """
+        try:
+            valores = np.asarray(f.f(malha), dtype=float)
+            if valores.shape == malha.shape:
+                f.avaliacoes += 1
+                return valores
+        except (TypeError, ValueError):
+            pass
+        return np.array([f(float(x)) for x in malha], dtype=float)
+
+    @staticmethod
+    def _serializavel(f):
+        """
+        Verifica se f pode ser enviada a outro processo. Lambdas geram
+        PicklingError; funções locais, AttributeError; objetos com estado não
+        serializável (locks, arquivos abertos), TypeError.
+        """
+        try:
+            pickle.dumps(f)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        return True
+
+    def todas_raizes(
+        self,
+        f,
+        a,
+        b,
+        tol=1e-9,
+        lim_iter=100,
+        subintervalos=1000,
+        processos=None,
+        tol_duplicata=None,
+    ):
+        """
+        Encontra todas as raízes de f em [a, b]. O intervalo é dividido em
+        subintervalos, f é avaliada de forma vetorizada na malha e cada
+        mudança de sinal é refinada pelo método de Brent, em paralelo em um
+        pool de processos quando f puder ser serializada. Raízes de
+        multiplicidade par (sem mudança de sinal) só são encontradas se
+        coincidirem com um ponto da malha.
+
+        Raízes que distam menos de `tol_duplicata` (por padrão, 2 * tol, o
+        erro máximo somado de duas raízes refinadas com tolerância tol) são
+        consideradas a mesma.
+        """
+        if tol_duplicata is None:
+            tol_duplicata = 2 * tol
+
+        f = self._memorizar(f)
+        malha = np.linspace(a, b, subintervalos + 1)
+        valores = self._avaliar_malha(f, malha)
+
+        raizes = [float(x) for x in malha[valores == 0]]
+        trocas = np.flatnonzero(valores[:-1] * valores[1:] < 0)
+        intervalos = [
+            (
+                f.f,
+                float(malha[i]),
+                float(malha[i + 1]),
+                float(valores[i]),
+                float(valores[i + 1]),
+                tol,
+                lim_iter,
+            )
+            for i in trocas
+        ]
+
+        resultados = None
+        avaliacoes_externas = 0
+        if processos != 1 and len(intervalos) > 1 and self._serializavel(f.f):
+            with ProcessPoolExecutor(max_workers=processos) as pool:
+                resultados = list(pool.map(_refinar_intervalo, intervalos))
+            # Cada iteração de Brent avalia f uma vez no processo filho
+            avaliacoes_externas = sum(it for _, _, it in resultados)
+        if resultados is None:
+            resultados = [
+                _refinar_intervalo((f,) + intervalo[1:]) for intervalo in intervalos
+            ]
+
+        iteracoes = 0
+        for raiz, _, it in resultados:
+            raizes.append(float(raiz))
+            iteracoes = max(iteracoes, it)
+
+        # Ordena e remove duplicatas (raízes mais próximas que tol_duplicata)
+        raizes.sort()
+        unicas = []
+        for raiz in raizes:
+            if not unicas or raiz - unicas[-1] > tol_duplicata:
+                unicas.append(raiz)
+
+        self.iteracoes = iteracoes
+        self.avaliacoes = f.avaliacoes + avaliacoes_externas
+        print(f"\n\t{len(unicas)} raízes encontradas em [{a}, {b}].")
+
+        return unicas
+
+    def newton_raphson(self, f, x0, x1, tol, lim_iter, df=None):
         """
         Encontra raízes de uma função f dentro de um intervalo [x1, x2]
         utilizando o método Newton-Raphson.
+
+        `df` é a derivada analítica de f; se omitida, é aproximada por
+        diferenças finitas. Cada valor de f e de f' é avaliado uma única vez
+        por iteração e reaproveitado na iteração seguinte.
         """
-        # Chute inicial usando a bisseção
-        x = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
-        
+        f = self._memorizar(f)
+        self.df = df
         d = Derivada
 
-        if d.diferencas_finitas(f, x) == 0:
+        def derivada(x):
+            return df(x) if df is not None else d.diferencas_finitas(f, x)
+
+        # Chute inicial usando a secante entre os extremos do intervalo
+        f_x0 = f(x0)
+        f_x1 = f(x1)
+        x = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
+        f_x = f(x)
+        df_x = derivada(x)
+
+        if df_x == 0:
             print("Derivada é zero no ponto inicial. O método de Newton-Raphson não pode ser aplicado.")
+            self._relatar(False, 0)
             return None
 
         iteracoes = 1
         convergencia = False
         while iteracoes <= lim_iter:
-            x_i = x - f(x) / d.diferencas_finitas(f, x)
+            x_i = x - f_x / df_x
+            f_x_i = f(x_i)
 
             # Verifica a condição de convergência
-            if abs(f(x_i)) < tol:
+            if abs(f_x_i) < tol:
+                x = x_i
                 convergencia = True
                 break
 
-            if d.diferencas_finitas(f, x_i) == 0:
+            df_x_i = derivada(x_i)
+            if df_x_i == 0:
                 print("Derivada é zero durante a iteração. O método de Newton-Raphson não pode ser aplicado.")
+                self._relatar(False, iteracoes)
                 return None
 
             # Atualiza os valores
-            x = x_i
+            x, f_x, df_x = x_i, f_x_i, df_x_i
             iteracoes += 1
 
-        if convergencia:
-            print(f"\n\tO método convergiu após {iteracoes} iterações.")
-        else:
-            print(f"\n\tO método não convergiu após {iteracoes} iterações.")
+        self._relatar(convergencia, iteracoes)
 
         return x
+
+    def newton_raphson_vetorizado(self, f, x0, tol, lim_iter, df=None, h=1e-5):
+        """
+        Aplica o método de Newton-Raphson a um array de pontos iniciais de uma
+        só vez. `f` (e `df`, se fornecida) devem aceitar arrays NumPy, como
+        funções compostas de ufuncs. Retorna um array com as raízes; entradas
+        que não convergiram (ou com derivada nula) ficam como NaN.
+        """
+        f = self._memorizar(f)
+        self.df = df
+        x = np.array(x0, dtype=float)
+        raizes = np.full(x.shape, np.nan)
+        ativos = np.ones(x.shape, dtype=bool)
+
+        f_x = f(x)
+        iteracoes = 0
+        while iteracoes < lim_iter and ativos.any():
+            convergiu = ativos & (np.abs(f_x) < tol)
+            raizes[convergiu] = x[convergiu]
+            ativos &= ~convergiu
+            if not ativos.any():
+                break
+
+            if df is not None:
+                df_x = df(x)
+            else:
+                df_x = (f(x + h) - f(x - h)) / (2 * h)
+
+            # Pontos com derivada nula são abandonados.
+            ativos &= df_x != 0
+            passo = np.divide(f_x, df_x, out=np.zeros(x.shape), where=ativos)
+            x = x - passo
+            f_x = f(x)
+            iteracoes += 1
+
+        convergiu = ativos & (np.abs(f_x) < tol)
+        raizes[convergiu] = x[convergiu]
+
+        self.iteracoes = iteracoes
+        self.avaliacoes = f.avaliacoes
+        total = int(np.count_nonzero(~np.isnan(raizes)))
+        print(
+            f"\n\t{total} de {raizes.size} pontos convergiram em até {iteracoes} "
+            f"iterações e {self.avaliacoes} avaliações vetorizadas de f."
+        )
+
+        return raizes